@@ -9,6 +9,7 @@ Usage:
     python quick_start.py /path/to/photos
     python quick_start.py /path/to/photos --output analysis_report.html
     python quick_start.py /path/to/photos --format json
+    python quick_start.py /path/to/photos --format parquet
 """
 
 import argparse
@@ -16,176 +17,355 @@ import sys
 import os
 from pathlib import Path
 import json
+import hashlib
 from datetime import datetime
 import webbrowser
 import tempfile
+from dataclasses import dataclass
+from string import Template
+
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+
+# Optional fast JSON encoder; the stdlib json module is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Arrow support for the Parquet cache and export
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 # Import our analyzer (assumes it's in same directory)
 try:
-    from photo_analyzer.photo_metadata_analyzer import PhotoMetadataAnalyzer
+    from photo_analyzer.photo_metadata_analyzer import (
+        EXTRACTOR_VERSION,
+        MIN_PHOTO_BYTES,
+        PhotoMetadataAnalyzer,
+        iter_image_files,
+        write_csv,
+    )
 except ImportError:
     print("Error: Make sure photo_metadata_analyzer.py is in the same directory")
     sys.exit(1)
 
 
-def generate_html_report(df, insights, output_path=None):
-    """Generate a standalone HTML report"""
+# Per-file cache columns recording the stat() result and extractor version of each row
+CACHE_KEY_COLUMNS = ["_mtime_ns", "_size", "_extractor_version"]
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "photo-tools")
 
-    if output_path is None:
-        output_path = tempfile.NamedTemporaryFile(suffix=".html", delete=False).name
+# Columns shown in the report's raw data table, in display order
+SAMPLE_COLUMNS = ["filename", "camera", "lens", "iso", "aperture", "datetime"]
+
+# Characters that must be escaped before interpolating metadata into the HTML report
+_ESC_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
 
-    # Basic HTML template with embedded CSS
-    html_template = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Photography Portfolio Analysis Report</title>
-        <style>
-            body { font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }
-            .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-            h1 { color: #2c3e50; text-align: center; margin-bottom: 30px; }
-            h2 { color: #34495e; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
-            .metric-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }
-            .metric-card { background: #ecf0f1; padding: 20px; border-radius: 8px; text-align: center; }
-            .metric-value { font-size: 2em; font-weight: bold; color: #3498db; }
-            .metric-label { color: #7f8c8d; margin-top: 5px; }
-            .insight-box { background: #e8f6f3; padding: 15px; border-left: 4px solid #1abc9c; margin: 15px 0; }
-            table { width: 100%; border-collapse: collapse; margin: 20px 0; }
-            th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
-            th { background-color: #3498db; color: white; }
-            tr:nth-child(even) { background-color: #f2f2f2; }
-            .charts-note { background: #fff3cd; padding: 15px; border-radius: 5px; margin: 20px 0; }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>📸 Photography Portfolio Analysis</h1>
-            <p style="text-align: center; color: #7f8c8d;">Generated on {timestamp}</p>
-            
-            <div class="metric-grid">
-                <div class="metric-card">
-                    <div class="metric-value">{total_photos}</div>
-                    <div class="metric-label">Total Photos</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{unique_cameras}</div>
-                    <div class="metric-label">Cameras Used</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{unique_lenses}</div>
-                    <div class="metric-label">Lenses Used</div>
-                </div>
-                <div class="metric-card">
-                    <div class="metric-value">{gps_photos}</div>
-                    <div class="metric-label">GPS Tagged</div>
-                </div>
+# Basic HTML template with embedded CSS, parsed once at import time
+_HTML_TEMPLATE = Template(
+    """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Photography Portfolio Analysis Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        h1 { color: #2c3e50; text-align: center; margin-bottom: 30px; }
+        h2 { color: #34495e; border-bottom: 2px solid #3498db; padding-bottom: 10px; }
+        .metric-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }
+        .metric-card { background: #ecf0f1; padding: 20px; border-radius: 8px; text-align: center; }
+        .metric-value { font-size: 2em; font-weight: bold; color: #3498db; }
+        .metric-label { color: #7f8c8d; margin-top: 5px; }
+        .insight-box { background: #e8f6f3; padding: 15px; border-left: 4px solid #1abc9c; margin: 15px 0; }
+        table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background-color: #3498db; color: white; }
+        tr:nth-child(even) { background-color: #f2f2f2; }
+        .charts-note { background: #fff3cd; padding: 15px; border-radius: 5px; margin: 20px 0; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>📸 Photography Portfolio Analysis</h1>
+        <p style="text-align: center; color: #7f8c8d;">Generated on $timestamp</p>
+        
+        <div class="metric-grid">
+            <div class="metric-card">
+                <div class="metric-value">$total_photos</div>
+                <div class="metric-label">Total Photos</div>
             </div>
-            
-            <h2>Equipment Usage</h2>
-            <div class="insight-box">
-                <strong>Most Used Camera:</strong> {most_used_camera}<br>
-                <strong>Most Used Lens:</strong> {most_used_lens}<br>
-                <strong>Average ISO:</strong> {avg_iso}
+            <div class="metric-card">
+                <div class="metric-value">$unique_cameras</div>
+                <div class="metric-label">Cameras Used</div>
             </div>
-            
-            <h3>Camera Distribution</h3>
-            <table>
-                <tr><th>Camera</th><th>Photos</th><th>Percentage</th></tr>
-                {camera_rows}
-            </table>
-            
-            <h3>Lens Distribution</h3>
-            <table>
-                <tr><th>Lens</th><th>Photos</th><th>Percentage</th></tr>  
-                {lens_rows}
-            </table>
-            
-            <h2>Technical Settings</h2>
-            <div class="insight-box">
-                <strong>ISO Range:</strong> {iso_range}<br>
-                <strong>Most Common ISO:</strong> {common_iso}<br>
-                <strong>Date Range:</strong> {date_range}
+            <div class="metric-card">
+                <div class="metric-value">$unique_lenses</div>
+                <div class="metric-label">Lenses Used</div>
             </div>
-            
-            <h2>Shooting Patterns</h2>
-            {shooting_patterns}
-            
-            <div class="charts-note">
-                <strong>💡 Pro Tip:</strong> For interactive charts and advanced analytics, 
-                run the full Streamlit dashboard with: <code>streamlit run streamlit_dashboard.py</code>
+            <div class="metric-card">
+                <div class="metric-value">$gps_photos</div>
+                <div class="metric-label">GPS Tagged</div>
             </div>
-            
-            <h2>Raw Data Summary</h2>
-            <p>First 10 photos from your collection:</p>
-            <table>
-                <tr>
-                    <th>Filename</th><th>Camera</th><th>Lens</th><th>ISO</th><th>Aperture</th><th>Date</th>
-                </tr>
-                {sample_data_rows}
-            </table>
-            
-            <footer style="margin-top: 40px; text-align: center; color: #7f8c8d; border-top: 1px solid #ecf0f1; padding-top: 20px;">
-                <p>Generated by Photography Metadata Analyzer</p>
-            </footer>
         </div>
-    </body>
-    </html>
+        
+        <h2>Equipment Usage</h2>
+        <div class="insight-box">
+            <strong>Most Used Camera:</strong> $most_used_camera<br>
+            <strong>Most Used Lens:</strong> $most_used_lens<br>
+            <strong>Average ISO:</strong> $avg_iso
+        </div>
+        
+        <h3>Camera Distribution</h3>
+        <table>
+            <tr><th>Camera</th><th>Photos</th><th>Percentage</th></tr>
+            $camera_rows
+        </table>
+        
+        <h3>Lens Distribution</h3>
+        <table>
+            <tr><th>Lens</th><th>Photos</th><th>Percentage</th></tr>  
+            $lens_rows
+        </table>
+        
+        <h2>Technical Settings</h2>
+        <div class="insight-box">
+            <strong>ISO Range:</strong> $iso_range<br>
+            <strong>Most Common ISO:</strong> $common_iso<br>
+            <strong>Date Range:</strong> $date_range
+        </div>
+        
+        <h2>Shooting Patterns</h2>
+        $shooting_patterns
+        
+        <div class="charts-note">
+            <strong>💡 Pro Tip:</strong> For interactive charts and advanced analytics, 
+            run the full Streamlit dashboard with: <code>streamlit run streamlit_dashboard.py</code>
+        </div>
+        
+        <h2>Raw Data Summary</h2>
+        <p>First 10 photos from your collection:</p>
+        <table>
+            <tr>
+                <th>Filename</th><th>Camera</th><th>Lens</th><th>ISO</th><th>Aperture</th><th>Date</th>
+            </tr>
+            $sample_data_rows
+        </table>
+        
+        <footer style="margin-top: 40px; text-align: center; color: #7f8c8d; border-top: 1px solid #ecf0f1; padding-top: 20px;">
+            <p>Generated by Photography Metadata Analyzer</p>
+        </footer>
+    </div>
+</body>
+</html>
+"""
+)
+
+
+def default_cache_path(directory):
+    """Cache file for a directory, keyed by a hash of its absolute path"""
+    digest = hashlib.sha1(os.path.abspath(directory).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(CACHE_DIR, f"{digest}.parquet")
+
+
+def process_with_cache(analyzer, directory, photo_files, cache_path, recursive, workers):
+    """Extract metadata, reusing cached rows for files whose mtime and size are unchanged
+
+    photo_files are the (path, size) pairs yielded by iter_image_files. Rows written by a
+    different EXTRACTOR_VERSION are re-extracted.
     """
+    paths = [path for path, _ in photo_files]
+    stats = {os.path.abspath(path): os.stat(path) for path in paths}
+
+    cached = None
+    if os.path.exists(cache_path):
+        try:
+            cached = pd.read_parquet(cache_path)
+        except (OSError, ValueError, pa.ArrowException) as e:
+            print(f"⚠️  Ignoring unreadable cache {cache_path}: {str(e)}")
+
+    cached_paths = set()
+    # Caches written before rows carried an extractor version are rebuilt
+    if cached is not None and "_extractor_version" not in cached:
+        cached = None
+    if cached is not None and len(cached) > 0:
+        cached = cached[cached["_extractor_version"] == EXTRACTOR_VERSION]
+        keys = cached["filepath"].map(os.path.abspath)
+        fresh = [
+            key in stats and stats[key].st_mtime_ns == mtime_ns and stats[key].st_size == size
+            for key, mtime_ns, size in zip(keys, cached["_mtime_ns"], cached["_size"])
+        ]
+        cached = cached[fresh]
+        cached_paths = set(keys[fresh])
+
+    # Sizes from the stat above, so the extraction workers don't stat these files again
+    stale_files = [
+        (path, stats[key].st_size)
+        for path, key in zip(paths, map(os.path.abspath, paths))
+        if key not in cached_paths
+    ]
+    print(f"🗃️  Cache: {len(cached_paths)} unchanged, {len(stale_files)} to extract")
+
+    # This Parquet file is the CLI's cache, so the analyzer's own record cache stays off
+    new_df = analyzer.process_photo_directory(
+        directory, recursive=recursive, workers=workers, file_list=stale_files, use_cache=False
+    )
+    if len(new_df) > 0:
+        new_stats = [stats[os.path.abspath(path)] for path in new_df["filepath"]]
+        new_df["_mtime_ns"] = [st.st_mtime_ns for st in new_stats]
+        new_df["_size"] = [st.st_size for st in new_stats]
+        new_df["_extractor_version"] = EXTRACTOR_VERSION
+
+    frames = [frame for frame in (cached, new_df) if frame is not None and len(frame) > 0]
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames, ignore_index=True)
+
+    # Keep the walk order so output doesn't depend on what was cached
+    order = {os.path.abspath(path): i for i, path in enumerate(paths)}
+    df = df.iloc[df["filepath"].map(lambda path: order[os.path.abspath(path)]).argsort()]
+    df = df.reset_index(drop=True)
+
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        df.to_parquet(cache_path, index=False)
+    except (OSError, ValueError, pa.ArrowException) as e:
+        print(f"⚠️  Could not update cache {cache_path}: {str(e)}")
+
+    return df.drop(columns=CACHE_KEY_COLUMNS)
+
+
+def _gps_count(df):
+    """Number of photos with both coordinates, reading only the two GPS columns"""
+    return int((df["latitude"].notna() & df["longitude"].notna()).sum())
+
+
+def _iso_stats(iso):
+    """Min, max and mean ISO in a single aggregation call"""
+    return iso.agg(["min", "max", "mean"])
+
+
+def _dt_summary(dt):
+    """Presence and range of a datetime series from a single pass over its valid values"""
+    valid = dt.dropna() if dt is not None else None
+    if valid is None or valid.empty:
+        return {"has": False, "min": None, "max": None}
+    return {"has": True, "min": valid.min(), "max": valid.max()}
+
+
+def _compute_datetime_stats(dt):
+    """Summarize shooting patterns from a datetime series without copying the frame"""
+    month_names = dt.dt.month_name()
+    return {
+        "peak_hour": dt.dt.hour.mode().iloc[0],
+        "most_active_month": month_names.mode().iloc[0] if not month_names.empty else "N/A",
+        "yearly_counts": dt.dt.year.value_counts().sort_index(),
+    }
+
+
+@dataclass
+class ReportContext:
+    """Aggregates shared by the HTML and console reports; None marks a missing column"""
+
+    total: int
+    camera_vc: pd.Series | None
+    lens_vc: pd.Series | None
+    iso_vc: pd.Series | None
+    iso_stats: pd.Series | None
+    dt_summary: dict
+    dt_stats: dict | None
+    gps_count: int | None
+    sample: pd.DataFrame
+
+
+def build_context(df):
+    """Count each equipment/ISO column once and derive every report statistic from it"""
+    cols = frozenset(df.columns)
+    dt_summary = _dt_summary(df.get("datetime"))
+    return ReportContext(
+        total=len(df),
+        camera_vc=df["camera"].value_counts() if "camera" in cols else None,
+        lens_vc=df["lens"].value_counts() if "lens" in cols else None,
+        iso_vc=df["iso"].value_counts() if "iso" in cols else None,
+        iso_stats=_iso_stats(df["iso"]) if "iso" in cols else None,
+        dt_summary=dt_summary,
+        dt_stats=_compute_datetime_stats(df["datetime"]) if dt_summary["has"] else None,
+        gps_count=_gps_count(df) if "latitude" in cols else None,
+        sample=df.head(10).reindex(columns=SAMPLE_COLUMNS, fill_value="N/A"),
+    )
+
+
+def generate_html_report(df, insights, output_path=None, context=None):
+    """Generate a standalone HTML report"""
+
+    if output_path is None:
+        output_path = tempfile.NamedTemporaryFile(suffix=".html", delete=False).name
+
+    ctx = context if context is not None else build_context(df)
+    camera_vc, lens_vc, iso_vc, iso_stats = ctx.camera_vc, ctx.lens_vc, ctx.iso_vc, ctx.iso_stats
 
     # Calculate metrics
-    total_photos = len(df)
-    unique_cameras = df["camera"].nunique() if "camera" in df.columns else 0
-    unique_lenses = df["lens"].nunique() if "lens" in df.columns else 0
-    gps_photos = len(df.dropna(subset=["latitude", "longitude"])) if "latitude" in df.columns else 0
+    total_photos = ctx.total
+    unique_cameras = len(camera_vc) if camera_vc is not None else 0
+    unique_lenses = len(lens_vc) if lens_vc is not None else 0
+    gps_photos = ctx.gps_count or 0
 
     # Most used equipment
     most_used_camera = (
-        df["camera"].mode().iloc[0] if "camera" in df.columns and not df["camera"].empty else "N/A"
+        str(camera_vc.index[0]).translate(_ESC_TABLE)
+        if camera_vc is not None and len(camera_vc)
+        else "N/A"
     )
     most_used_lens = (
-        df["lens"].mode().iloc[0] if "lens" in df.columns and not df["lens"].empty else "N/A"
+        str(lens_vc.index[0]).translate(_ESC_TABLE)
+        if lens_vc is not None and len(lens_vc)
+        else "N/A"
     )
-    avg_iso = f"{df['iso'].mean():.0f}" if "iso" in df.columns else "N/A"
+    avg_iso = f"{iso_stats['mean']:.0f}" if iso_stats is not None else "N/A"
 
     # ISO statistics
-    iso_range = f"{df['iso'].min():.0f} - {df['iso'].max():.0f}" if "iso" in df.columns else "N/A"
-    common_iso = df["iso"].mode().iloc[0] if "iso" in df.columns and not df["iso"].empty else "N/A"
+    iso_range = (
+        f"{iso_stats['min']:.0f} - {iso_stats['max']:.0f}" if iso_stats is not None else "N/A"
+    )
+    common_iso = iso_vc.index[0] if iso_vc is not None and len(iso_vc) else "N/A"
 
     # Date range
-    if "datetime" in df.columns and not df["datetime"].isna().all():
-        date_range = f"{df['datetime'].min().strftime('%Y-%m-%d')} to {df['datetime'].max().strftime('%Y-%m-%d')}"
+    dt_summary = ctx.dt_summary
+    if dt_summary["has"]:
+        date_range = f"{dt_summary['min']:%Y-%m-%d} to {dt_summary['max']:%Y-%m-%d}"
     else:
         date_range = "N/A"
 
     # Generate table rows
-    def generate_table_rows(series, total):
-        rows = []
-        for item, count in series.value_counts().head(10).items():
-            percentage = (count / total) * 100
-            rows.append(f"<tr><td>{item}</td><td>{count}</td><td>{percentage:.1f}%</td></tr>")
-        return "\n".join(rows)
+    def generate_table_rows(value_counts, total):
+        inv_total = 100.0 / total
+        return "\n".join(
+            f"<tr><td>{str(item).translate(_ESC_TABLE)}</td><td>{count}</td>"
+            f"<td>{count * inv_total:.1f}%</td></tr>"
+            for item, count in value_counts.head(10).items()
+        )
 
     camera_rows = (
-        generate_table_rows(df["camera"], total_photos)
-        if "camera" in df.columns
+        generate_table_rows(camera_vc, total_photos)
+        if camera_vc is not None
         else '<tr><td colspan="3">No camera data</td></tr>'
     )
     lens_rows = (
-        generate_table_rows(df["lens"], total_photos)
-        if "lens" in df.columns
+        generate_table_rows(lens_vc, total_photos)
+        if lens_vc is not None
         else '<tr><td colspan="3">No lens data</td></tr>'
     )
 
     # Shooting patterns
     shooting_patterns = ""
-    if "datetime" in df.columns and not df["datetime"].isna().all():
-        df_temp = df.copy()
-        df_temp["hour"] = df_temp["datetime"].dt.hour
-        peak_hour = df_temp["hour"].mode().iloc[0]
+    if dt_summary["has"]:
+        dt_stats = ctx.dt_stats
         shooting_patterns = f"""
         <div class="insight-box">
-            <strong>Peak Shooting Hour:</strong> {peak_hour}:00<br>
-            <strong>Most Active Month:</strong> {df_temp['datetime'].dt.month_name().mode().iloc[0] if not df_temp['datetime'].dt.month_name().empty else 'N/A'}
+            <strong>Peak Shooting Hour:</strong> {dt_stats['peak_hour']}:00<br>
+            <strong>Most Active Month:</strong> {dt_stats['most_active_month']}
         </div>
         """
     else:
@@ -194,28 +374,31 @@ def generate_html_report(df, insights, output_path=None):
         )
 
     # Sample data rows
-    sample_data = df.head(10)
-    sample_rows = []
-    for _, row in sample_data.iterrows():
-        date_str = row.get("datetime", "N/A")
-        if pd.notna(date_str) and hasattr(date_str, "strftime"):
-            date_str = date_str.strftime("%Y-%m-%d")
+    sample = ctx.sample.copy()
+    if is_datetime64_any_dtype(sample["datetime"]):
+        sample["datetime"] = sample["datetime"].dt.strftime("%Y-%m-%d").fillna("N/A")
+    # Escape every cell column-wise rather than calling html.escape per value
+    sample = sample.astype(str)
+    for col in SAMPLE_COLUMNS:
+        sample[col] = sample[col].str.translate(_ESC_TABLE)
 
-        sample_rows.append(
-            f"""
+    sample_rows = []
+    for filename, camera, lens, iso, aperture, date_str in sample.itertuples(
+        index=False, name=None
+    ):
+        sample_rows.append(f"""
         <tr>
-            <td>{row.get('filename', 'N/A')}</td>
-            <td>{row.get('camera', 'N/A')}</td>
-            <td>{row.get('lens', 'N/A')}</td>
-            <td>{row.get('iso', 'N/A')}</td>
-            <td>{row.get('aperture', 'N/A')}</td>
+            <td>{filename}</td>
+            <td>{camera}</td>
+            <td>{lens}</td>
+            <td>{iso}</td>
+            <td>{aperture}</td>
             <td>{date_str}</td>
         </tr>
-        """
-        )
+        """)
 
     # Fill in the template
-    html_content = html_template.format(
+    html_content = _HTML_TEMPLATE.substitute(
         timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         total_photos=total_photos,
         unique_cameras=unique_cameras,
@@ -233,49 +416,52 @@ def generate_html_report(df, insights, output_path=None):
         sample_data_rows="\n".join(sample_rows),
     )
 
-    # Write to file
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    # Encode once and write the bytes in a single call
+    Path(output_path).write_bytes(html_content.encode("utf-8"))
 
     return output_path
 
 
-def print_summary_report(df, insights):
+def print_summary_report(df, insights, context=None):
     """Print a text summary to console"""
+    ctx = context if context is not None else build_context(df)
     print("\n" + "=" * 60)
     print("📸 PHOTOGRAPHY PORTFOLIO ANALYSIS SUMMARY")
     print("=" * 60)
 
     # Basic stats
     print(f"\n📊 OVERVIEW:")
-    print(f"   Total Photos: {len(df)}")
-    print(
-        f"   Date Range: {df['datetime'].min().strftime('%Y-%m-%d') if 'datetime' in df.columns and not df['datetime'].isna().all() else 'N/A'} to {df['datetime'].max().strftime('%Y-%m-%d') if 'datetime' in df.columns and not df['datetime'].isna().all() else 'N/A'}"
-    )
-    print(
-        f"   GPS Tagged: {len(df.dropna(subset=['latitude', 'longitude']))} ({(len(df.dropna(subset=['latitude', 'longitude'])) / len(df) * 100):.1f}%)"
-        if "latitude" in df.columns
-        else "GPS Tagged: 0"
-    )
+    print(f"   Total Photos: {ctx.total}")
+    dt_summary = ctx.dt_summary
+    if dt_summary["has"]:
+        print(f"   Date Range: {dt_summary['min']:%Y-%m-%d} to {dt_summary['max']:%Y-%m-%d}")
+    else:
+        print("   Date Range: N/A to N/A")
+    if ctx.gps_count is not None:
+        gps_n = ctx.gps_count
+        print(f"   GPS Tagged: {gps_n} ({gps_n / ctx.total * 100:.1f}%)")
+    else:
+        print("   GPS Tagged: 0")
 
     # Equipment
     print(f"\n📷 EQUIPMENT:")
-    if "camera" in df.columns:
-        print(f"   Cameras Used: {df['camera'].nunique()}")
-        for camera, count in df["camera"].value_counts().head(3).items():
-            print(f"     • {camera}: {count} photos ({count/len(df)*100:.1f}%)")
+    if ctx.camera_vc is not None:
+        print(f"   Cameras Used: {len(ctx.camera_vc)}")
+        for camera, count in ctx.camera_vc.head(3).items():
+            print(f"     • {camera}: {count} photos ({count/ctx.total*100:.1f}%)")
 
-    if "lens" in df.columns:
-        print(f"   Lenses Used: {df['lens'].nunique()}")
-        for lens, count in df["lens"].value_counts().head(3).items():
-            print(f"     • {lens}: {count} photos ({count/len(df)*100:.1f}%)")
+    if ctx.lens_vc is not None:
+        print(f"   Lenses Used: {len(ctx.lens_vc)}")
+        for lens, count in ctx.lens_vc.head(3).items():
+            print(f"     • {lens}: {count} photos ({count/ctx.total*100:.1f}%)")
 
     # Settings
     print(f"\n⚙️  CAMERA SETTINGS:")
-    if "iso" in df.columns:
-        print(f"   ISO Range: {df['iso'].min():.0f} - {df['iso'].max():.0f}")
-        print(f"   Average ISO: {df['iso'].mean():.0f}")
-        print(f"   Most Common ISO: {df['iso'].mode().iloc[0] if not df['iso'].empty else 'N/A'}")
+    if ctx.iso_stats is not None:
+        iso_stats, iso_vc = ctx.iso_stats, ctx.iso_vc
+        print(f"   ISO Range: {iso_stats['min']:.0f} - {iso_stats['max']:.0f}")
+        print(f"   Average ISO: {iso_stats['mean']:.0f}")
+        print(f"   Most Common ISO: {iso_vc.index[0] if len(iso_vc) else 'N/A'}")
 
     if "aperture" in df.columns:
         aperture_counts = df["aperture"].value_counts().head(3)
@@ -284,20 +470,15 @@ def print_summary_report(df, insights):
         )
 
     # Patterns
-    if "datetime" in df.columns and not df["datetime"].isna().all():
+    if dt_summary["has"]:
         print(f"\n📅 SHOOTING PATTERNS:")
-        df_temp = df.copy()
-        df_temp["hour"] = df_temp["datetime"].dt.hour
-        df_temp["month"] = df_temp["datetime"].dt.month
-        print(f"   Peak Hour: {df_temp['hour'].mode().iloc[0]}:00")
-        print(
-            f"   Most Active Month: {df_temp['datetime'].dt.month_name().mode().iloc[0] if not df_temp['datetime'].dt.month_name().empty else 'N/A'}"
-        )
+        dt_stats = ctx.dt_stats
+        print(f"   Peak Hour: {dt_stats['peak_hour']}:00")
+        print(f"   Most Active Month: {dt_stats['most_active_month']}")
 
         # Photos per year
-        yearly_counts = df_temp["datetime"].dt.year.value_counts().sort_index()
         print(f"   Photos by Year:")
-        for year, count in yearly_counts.items():
+        for year, count in dt_stats["yearly_counts"].items():
             print(f"     • {year}: {count} photos")
 
     print("\n" + "=" * 60)
@@ -313,7 +494,7 @@ def main():
     parser.add_argument(
         "--format",
         "-f",
-        choices=["json", "csv", "html"],
+        choices=["json", "csv", "parquet", "html"],
         default="console",
         help="Output format (default: console summary)",
     )
@@ -323,6 +504,20 @@ def main():
     parser.add_argument(
         "--open", action="store_true", help="Automatically open HTML report in browser"
     )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes for EXIF extraction (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache",
+        help="Parquet file caching extracted metadata (default: ~/.cache/photo-tools/)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-extract every file, ignoring the cache"
+    )
 
     args = parser.parse_args()
 
@@ -340,7 +535,27 @@ def main():
     try:
         # Process photos
         print("⏳ Processing photos...")
-        df = analyzer.process_photo_directory(args.directory, recursive=args.recursive)
+        extensions = tuple(analyzer.supported_formats)
+        photo_files = list(
+            iter_image_files(args.directory, args.recursive, extensions, MIN_PHOTO_BYTES)
+        )
+        if args.no_cache or pa is None:
+            df = analyzer.process_photo_directory(
+                args.directory,
+                recursive=args.recursive,
+                workers=args.workers,
+                file_list=photo_files,
+                use_cache=False,
+            )
+        else:
+            df = process_with_cache(
+                analyzer,
+                args.directory,
+                photo_files,
+                args.cache or default_cache_path(args.directory),
+                args.recursive,
+                args.workers,
+            )
 
         if len(df) == 0:
             print("⚠️  No photos with EXIF data found in the specified directory")
@@ -351,10 +566,11 @@ def main():
 
         # Generate insights
         insights = analyzer.generate_insights(df)
+        context = build_context(df)
 
         # Output based on format
         if args.format == "console":
-            print_summary_report(df, insights)
+            print_summary_report(df, insights, context)
 
         elif args.format == "json":
             output_file = (
@@ -368,26 +584,44 @@ def main():
                     "analysis_date": datetime.now().isoformat(),
                     "directory": args.directory,
                 },
-                "insights": insights,
+                "insights": insights.to_dict(),
                 "sample_data": df.head(10).to_dict("records"),
             }
 
-            with open(output_file, "w") as f:
-                json.dump(export_data, f, indent=2, default=str)
+            if orjson is not None:
+                json_options = (
+                    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                )
+                Path(output_file).write_bytes(
+                    orjson.dumps(export_data, option=json_options, default=str)
+                )
+            else:
+                with open(output_file, "w") as f:
+                    json.dump(export_data, f, indent=2, default=str)
             print(f"📄 JSON report saved to: {output_file}")
 
         elif args.format == "csv":
             output_file = (
                 args.output or f"photo_metadata_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             )
-            df.to_csv(output_file, index=False)
+            write_csv(df, output_file)
             print(f"📊 CSV data saved to: {output_file}")
 
+        elif args.format == "parquet":
+            if pa is None:
+                print("❌ Parquet export requires pyarrow; use --format csv instead")
+                sys.exit(1)
+            output_file = (
+                args.output or f"photo_metadata_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+            )
+            df.to_parquet(output_file, index=False)
+            print(f"📊 Parquet data saved to: {output_file}")
+
         elif args.format == "html" or args.output:
             output_file = (
                 args.output or f"photo_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
             )
-            html_path = generate_html_report(df, insights, output_file)
+            html_path = generate_html_report(df, insights, output_file, context)
             print(f"📋 HTML report saved to: {html_path}")
 
             if args.open:
@@ -400,7 +634,4 @@ def main():
 
 
 if __name__ == "__main__":
-    # Add pandas import for the generate_html_report function
-    import pandas as pd
-
     main()
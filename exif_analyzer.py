@@ -1,20 +1,221 @@
 #!/usr/bin/env python3
 import sys
 import os
+import io
 import json
+import math
+import dbm
+import shelve
 import argparse
 from pathlib import Path
 from datetime import datetime
+from fractions import Fraction
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, Any, Tuple, Optional, Union
 
+import numpy as np
+
+# Optional fast JSON encoder; the stdlib json module is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from PIL import Image
-    from PIL.ExifTags import TAGS, GPSTAGS
+    from PIL.ExifTags import TAGS, GPSTAGS, IFD
+    from PIL.TiffImagePlugin import IFDRational
 except ImportError:
     print("❌ Error: Pillow library not found.")
     print("Install with: pip install Pillow")
     sys.exit(1)
 
+# Formats whose EXIF block sits in the header. For anything else (PNG, BMP, GIF)
+# getexif() would stream the whole file looking for it, so it is skipped.
+# MPO is Pillow's name for multi-picture JPEGs.
+EXIF_CAPABLE_FORMATS = {"JPEG", "MPO", "TIFF", "WEBP", "HEIF"}
+
+# Plain-dict copies of Pillow's tag tables for the per-tag name lookups
+_TAG_NAME = dict(TAGS)
+_GPS_TAG_NAME = dict(GPSTAGS)
+
+# Persistent per-file analysis cache for batch runs, keyed by analyzer version and absolute path
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "photo-tools", "exif_analyzer.db")
+
+# Bump whenever analyze_image changes the results it returns, so older cache entries are ignored
+ANALYZER_VERSION = 1
+
+# JPEG headers (APP1 EXIF segment and SOF dimensions) fit well within this prefix
+JPEG_HEADER_BYTES = 128 * 1024
+
+def _float_from_none(value, value_name):
+    return None, "None value"
+
+def _float_from_sequence(value, value_name):
+    # Tuple fractions (most common for camera settings)
+    if len(value) >= 2:
+        numerator, denominator = value[0], value[1]
+        if denominator == 0:
+            return None, f"Division by zero in fraction {value}"
+        try:
+            result = float(numerator) / float(denominator)
+        except (TypeError, ValueError, ZeroDivisionError) as e:
+            return None, f"Conversion error: {str(e)}"
+        return result, f"Fraction {numerator}/{denominator} = {result}"
+    
+    # Single-item tuples/lists
+    if len(value) == 1:
+        return ExifValueConverter.to_float(value[0], f"{value_name}[0]")
+    
+    return None, f"Unknown type {type(value)}: {value}"
+
+def _float_from_number(value, value_name):
+    return float(value), f"Direct numeric: {value}"
+
+def _float_from_rational(value, value_name):
+    # Pillow's EXIF rational type; read numerator/denominator directly
+    if value.denominator == 0:
+        return None, f"Division by zero in fraction {value.numerator}/{value.denominator}"
+    result = value.numerator / value.denominator
+    return result, f"Fraction {value.numerator}/{value.denominator} = {result}"
+
+def _float_from_str(value, value_name):
+    try:
+        return float(value), f"String parsed: '{value}'"
+    except ValueError:
+        return None, f"Non-numeric string: '{value}'"
+
+def _float_from_bytes(value, value_name):
+    # Bytes data should not be converted to numeric
+    return None, f"Bytes data ({len(value)} bytes) - not numeric"
+
+# Exact-type dispatch for ExifValueConverter.to_float
+_TO_FLOAT_HANDLERS = {
+    type(None): _float_from_none,
+    IFDRational: _float_from_rational,
+    tuple: _float_from_sequence,
+    list: _float_from_sequence,
+    int: _float_from_number,
+    float: _float_from_number,
+    str: _float_from_str,
+    bytes: _float_from_bytes,
+}
+
+def _to_float_fast(value):
+    """Same value as ExifValueConverter.to_float, without building the conversion message"""
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return float(value)
+    if value_type is IFDRational:
+        return None if value.denominator == 0 else value.numerator / value.denominator
+    if (value_type is tuple or value_type is list) and len(value) >= 2:
+        if value[1] == 0:
+            return None
+        try:
+            return float(value[0]) / float(value[1])
+        except (TypeError, ValueError, ZeroDivisionError):
+            return None
+    
+    # Rare types (strings, bytes, single-item tuples, subclasses) take the full converter
+    return ExifValueConverter.to_float(value)[0]
+
+def _fast_exif_datetime(dt_string):
+    """
+    Reformat a fixed-width "YYYY:MM:DD HH:MM:SS[.subsec]" string by slicing, without strptime
+    Returns None when the string is not in that layout so the caller can fall back
+    """
+    if not isinstance(dt_string, str) or len(dt_string) < 19:
+        return None
+    if (dt_string[4] != ':' or dt_string[7] != ':' or dt_string[10] != ' '
+            or dt_string[13] != ':' or dt_string[16] != ':'):
+        return None
+    
+    digits = (dt_string[0:4] + dt_string[5:7] + dt_string[8:10] + dt_string[11:13]
+              + dt_string[14:16] + dt_string[17:19])
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    
+    subsec = dt_string[19:]
+    if subsec and not (subsec[0] == '.' and subsec[1:].isascii() and subsec[1:].isdigit()):
+        return None
+    
+    # Range-check the fields the same way strptime would
+    try:
+        datetime(int(dt_string[0:4]), int(dt_string[5:7]), int(dt_string[8:10]),
+                 int(dt_string[11:13]), int(dt_string[14:16]), int(dt_string[17:19]))
+    except ValueError:
+        return None
+    
+    return (f"{dt_string[0:4]}-{dt_string[5:7]}-{dt_string[8:10]} "
+            f"{dt_string[11:13]}:{dt_string[14:16]}:{dt_string[17:19]}{subsec}")
+
+# Lookup tables for decoding numeric EXIF enums
+_FLASH_MODES = {
+    0: "No flash",
+    1: "Flash fired",
+    5: "Strobe return light not detected",
+    7: "Strobe return light detected",
+    9: "Flash fired, compulsory flash mode",
+    13: "Flash fired, compulsory flash mode, return light not detected",
+    15: "Flash fired, compulsory flash mode, return light detected",
+    16: "Flash did not fire, compulsory flash mode",
+    24: "Flash did not fire, auto mode",
+    25: "Flash fired, auto mode",
+    29: "Flash fired, auto mode, return light not detected",
+    31: "Flash fired, auto mode, return light detected",
+    32: "No flash function",
+    65: "Flash fired, red-eye reduction mode",
+    69: "Flash fired, red-eye reduction mode, return light not detected",
+    71: "Flash fired, red-eye reduction mode, return light detected",
+    73: "Flash fired, compulsory flash mode, red-eye reduction mode",
+    77: "Flash fired, compulsory flash mode, red-eye reduction mode, return light not detected",
+    79: "Flash fired, compulsory flash mode, red-eye reduction mode, return light detected",
+    89: "Flash fired, auto mode, red-eye reduction mode",
+    93: "Flash fired, auto mode, return light not detected, red-eye reduction mode",
+    95: "Flash fired, auto mode, return light detected, red-eye reduction mode"
+}
+
+_METERING_MODES = {
+    0: "Unknown",
+    1: "Average",
+    2: "Center-weighted average",
+    3: "Spot",
+    4: "Multi-spot",
+    5: "Pattern",
+    6: "Partial",
+    255: "Other"
+}
+
+_WB_MODES = {
+    0: "Auto",
+    1: "Manual",
+    2: "Auto (warm light)",
+    3: "Auto (cool light)",
+    4: "Auto (daylight)",
+    5: "Auto (cloudy)",
+    6: "Auto (tungsten)",
+    7: "Auto (fluorescent)",
+    8: "Auto (flash)",
+    9: "Manual",
+    10: "Cloudy",
+    11: "Shade",
+    17: "Manual",
+    18: "Daylight fluorescent",
+    19: "Day white fluorescent",
+    20: "Cool white fluorescent",
+    21: "White fluorescent",
+    22: "Warm white fluorescent",
+    23: "Standard light A",
+    24: "Standard light B",
+    25: "Standard light C",
+    26: "D55",
+    27: "D65",
+    28: "D75",
+    29: "D50",
+    30: "ISO studio tungsten"
+}
+
 class ExifValueConverter:
     """Handles safe conversion of EXIF values to usable formats"""
     
@@ -24,43 +225,16 @@ class ExifValueConverter:
         Safely convert EXIF values to float, handling all possible formats
         Returns: (float_value, conversion_info) or (None, error_info)
         """
-        try:
-            if value is None:
-                return None, "None value"
-            
-            # Handle tuple fractions (most common for camera settings)
-            if isinstance(value, (tuple, list)) and len(value) >= 2:
-                numerator, denominator = value[0], value[1]
-                if denominator == 0:
-                    return None, f"Division by zero in fraction {value}"
-                result = float(numerator) / float(denominator)
-                return result, f"Fraction {numerator}/{denominator} = {result}"
-            
-            # Handle direct numeric values
-            elif isinstance(value, (int, float)):
-                return float(value), f"Direct numeric: {value}"
-            
-            # Handle string values
-            elif isinstance(value, str):
-                try:
-                    return float(value), f"String parsed: '{value}'"
-                except ValueError:
-                    return None, f"Non-numeric string: '{value}'"
-            
-            # Handle bytes (should not be converted to numeric)
-            elif isinstance(value, bytes):
-                return None, f"Bytes data ({len(value)} bytes) - not numeric"
-            
-            # Handle single-item tuples/lists
-            elif isinstance(value, (tuple, list)) and len(value) == 1:
-                return ExifValueConverter.to_float(value[0], f"{value_name}[0]")
-            
-            # Unknown type
-            else:
-                return None, f"Unknown type {type(value)}: {value}"
-                
-        except Exception as e:
-            return None, f"Conversion error: {str(e)}"
+        handler = _TO_FLOAT_HANDLERS.get(type(value))
+        if handler is not None:
+            return handler(value, value_name)
+        
+        # Subclasses of the handled types (e.g. bool) miss the exact-type lookup
+        for value_type, handler in _TO_FLOAT_HANDLERS.items():
+            if isinstance(value, value_type):
+                return handler(value, value_name)
+        
+        return None, f"Unknown type {type(value)}: {value}"
     
     @staticmethod
     def format_shutter_speed(time_seconds):
@@ -68,14 +242,21 @@ class ExifValueConverter:
         if time_seconds is None:
             return "Unknown"
         
-        if time_seconds < 1:
-            try:
-                reciprocal = int(round(1 / time_seconds))
-                return f"1/{reciprocal}"
-            except:
-                return f"{time_seconds:.6f}s"
-        else:
-            return f"{time_seconds}s"
+        if time_seconds <= 0:
+            return f"{time_seconds:.6f}s"
+        
+        if time_seconds >= 1:
+            return f"{time_seconds:g}s"
+        
+        # Recover the rational the camera stored (e.g. 1/250) from its float value
+        fraction = Fraction(time_seconds).limit_denominator(100000)
+        if fraction.numerator == 1:
+            return f"1/{fraction.denominator}"
+        
+        # Slow speeds such as 0.3s read as decimals; APEX-derived fast speeds round to 1/n
+        if time_seconds >= 0.3:
+            return f"{float(fraction):g}s"
+        return f"1/{round(1 / time_seconds)}"
     
     @staticmethod
     def format_aperture(f_number):
@@ -93,6 +274,10 @@ class ExifValueConverter:
         if not dt_string:
             return "Unknown"
         
+        formatted = _fast_exif_datetime(dt_string)
+        if formatted is not None:
+            return formatted
+        
         try:
             # EXIF datetime format: "YYYY:MM:DD HH:MM:SS"
             dt = datetime.strptime(dt_string, "%Y:%m:%d %H:%M:%S")
@@ -111,32 +296,7 @@ class ExifValueConverter:
         if flash_value is None:
             return "Unknown"
         
-        flash_modes = {
-            0: "No flash",
-            1: "Flash fired",
-            5: "Strobe return light not detected",
-            7: "Strobe return light detected",
-            9: "Flash fired, compulsory flash mode",
-            13: "Flash fired, compulsory flash mode, return light not detected",
-            15: "Flash fired, compulsory flash mode, return light detected",
-            16: "Flash did not fire, compulsory flash mode",
-            24: "Flash did not fire, auto mode",
-            25: "Flash fired, auto mode",
-            29: "Flash fired, auto mode, return light not detected",
-            31: "Flash fired, auto mode, return light detected",
-            32: "No flash function",
-            65: "Flash fired, red-eye reduction mode",
-            69: "Flash fired, red-eye reduction mode, return light not detected",
-            71: "Flash fired, red-eye reduction mode, return light detected",
-            73: "Flash fired, compulsory flash mode, red-eye reduction mode",
-            77: "Flash fired, compulsory flash mode, red-eye reduction mode, return light not detected",
-            79: "Flash fired, compulsory flash mode, red-eye reduction mode, return light detected",
-            89: "Flash fired, auto mode, red-eye reduction mode",
-            93: "Flash fired, auto mode, return light not detected, red-eye reduction mode",
-            95: "Flash fired, auto mode, return light detected, red-eye reduction mode"
-        }
-        
-        return flash_modes.get(int(flash_value), f"Unknown mode ({flash_value})")
+        return _FLASH_MODES.get(int(flash_value), f"Unknown mode ({flash_value})")
     
     @staticmethod
     def decode_metering_mode(mode_value):
@@ -144,18 +304,7 @@ class ExifValueConverter:
         if mode_value is None:
             return "Unknown"
         
-        metering_modes = {
-            0: "Unknown",
-            1: "Average",
-            2: "Center-weighted average",
-            3: "Spot",
-            4: "Multi-spot",
-            5: "Pattern",
-            6: "Partial",
-            255: "Other"
-        }
-        
-        return metering_modes.get(int(mode_value), f"Unknown mode ({mode_value})")
+        return _METERING_MODES.get(int(mode_value), f"Unknown mode ({mode_value})")
     
     @staticmethod
     def decode_white_balance(wb_value):
@@ -163,36 +312,61 @@ class ExifValueConverter:
         if wb_value is None:
             return "Unknown"
         
-        wb_modes = {
-            0: "Auto",
-            1: "Manual",
-            2: "Auto (warm light)",
-            3: "Auto (cool light)",
-            4: "Auto (daylight)",
-            5: "Auto (cloudy)",
-            6: "Auto (tungsten)",
-            7: "Auto (fluorescent)",
-            8: "Auto (flash)",
-            9: "Manual",
-            10: "Cloudy",
-            11: "Shade",
-            17: "Manual",
-            18: "Daylight fluorescent",
-            19: "Day white fluorescent",
-            20: "Cool white fluorescent",
-            21: "White fluorescent",
-            22: "Warm white fluorescent",
-            23: "Standard light A",
-            24: "Standard light B",
-            25: "Standard light C",
-            26: "D55",
-            27: "D65",
-            28: "D75",
-            29: "D50",
-            30: "ISO studio tungsten"
-        }
-        
-        return wb_modes.get(int(wb_value), f"Unknown mode ({wb_value})")
+        return _WB_MODES.get(int(wb_value), f"Unknown mode ({wb_value})")
+
+# Tags read by each CameraSettingsExtractor method, in display order
+_APERTURE_TAGS = ('FNumber', 'ApertureValue', 'MaxApertureValue')
+_SHUTTER_TAGS = ('ExposureTime', 'ShutterSpeedValue')
+_FOCAL_TAGS = ('FocalLength', 'FocalLengthIn35mmFilm')
+
+_ISO_TAGS = [
+    'ISOSpeedRatings',
+    'ISO',
+    'RecommendedExposureIndex',
+    'PhotographicSensitivity'
+]
+
+_EXPOSURE_FIELDS = {
+    'ExposureMode': 'Exposure Mode',
+    'ExposureProgram': 'Exposure Program',
+    'ExposureBiasValue': 'Exposure Bias',
+    'MeteringMode': 'Metering Mode',
+    'LightSource': 'Light Source',
+    'Flash': 'Flash',
+    'WhiteBalance': 'White Balance',
+    'SceneCaptureType': 'Scene Type',
+    'GainControl': 'Gain Control',
+    'Contrast': 'Contrast',
+    'Saturation': 'Saturation',
+    'Sharpness': 'Sharpness'
+}
+
+_TEXT_FIELDS = {
+    'Make': 'Camera Make',
+    'Model': 'Camera Model',
+    'LensModel': 'Lens Model',
+    'LensMake': 'Lens Make',
+    'Software': 'Software',
+    'DateTime': 'Date/Time',
+    'DateTimeOriginal': 'Original Date/Time',
+    'DateTimeDigitized': 'Digitized Date/Time',
+    'Artist': 'Artist',
+    'Copyright': 'Copyright',
+    'ImageDescription': 'Description'
+}
+
+# Tag name -> camera_analysis section, so one pass over the EXIF dict routes every relevant tag
+_SETTING_SECTIONS = {
+    **dict.fromkeys(_APERTURE_TAGS, 'aperture'),
+    **dict.fromkeys(_SHUTTER_TAGS, 'shutter_speed'),
+    **dict.fromkeys(_ISO_TAGS, 'iso'),
+    **dict.fromkeys(_FOCAL_TAGS, 'focal_length'),
+    **dict.fromkeys(_EXPOSURE_FIELDS, 'exposure_info'),
+    **dict.fromkeys(_TEXT_FIELDS, 'additional_info'),
+}
+
+# Sentinel for tags absent from the EXIF dict (a tag's value may legitimately be None)
+_MISSING = object()
 
 class CameraSettingsExtractor:
     """Extracts and analyzes camera settings from EXIF data"""
@@ -206,16 +380,24 @@ class CameraSettingsExtractor:
         if self.verbose:
             print(message)
     
+    def _to_float(self, value, value_name):
+        """Convert an EXIF value, building the conversion message only when it will be printed"""
+        if self.verbose:
+            return self.converter.to_float(value, value_name)
+        return _to_float_fast(value), None
+    
     def extract_setting(self, exif_data, tag_name, setting_type):
         """Generic method to extract and convert a camera setting"""
-        if tag_name not in exif_data:
+        raw_value = exif_data.get(tag_name, _MISSING)
+        if raw_value is _MISSING:
             return None, f"Tag '{tag_name}' not found"
         
-        raw_value = exif_data[tag_name]
-        self._print(f"  ✅ {tag_name} found: {raw_value} (type: {type(raw_value)})")
+        if self.verbose:
+            self._print(f"  ✅ {tag_name} found: {raw_value} (type: {type(raw_value)})")
         
-        converted_value, conversion_info = self.converter.to_float(raw_value, tag_name)
-        self._print(f"     Conversion: {conversion_info}")
+        converted_value, conversion_info = self._to_float(raw_value, tag_name)
+        if self.verbose:
+            self._print(f"     Conversion: {conversion_info}")
         
         return converted_value, conversion_info
     
@@ -228,26 +410,33 @@ class CameraSettingsExtractor:
         f_number, _ = self.extract_setting(exif_data, 'FNumber', 'aperture')
         if f_number is not None:
             aperture_results['FNumber'] = f_number
-            self._print(f"     Final aperture: {self.converter.format_aperture(f_number)}")
+            if self.verbose:
+                self._print(f"     Final aperture: {self.converter.format_aperture(f_number)}")
         
         # Method 2: ApertureValue (APEX system)
         apex_value, _ = self.extract_setting(exif_data, 'ApertureValue', 'aperture')
         if apex_value is not None:
             try:
-                f_stop = 2 ** (apex_value / 2)
+                f_stop = _apex_aperture(apex_value)
+                if not math.isfinite(f_stop):
+                    raise OverflowError("result out of range")
                 aperture_results['ApertureValue'] = f_stop
-                self._print(f"     APEX calculation: 2^({apex_value}/2) = {self.converter.format_aperture(f_stop)}")
-            except Exception as e:
+                if self.verbose:
+                    self._print(f"     APEX calculation: 2^({apex_value}/2) = {self.converter.format_aperture(f_stop)}")
+            except (OverflowError, TypeError) as e:
                 self._print(f"     ❌ APEX calculation failed: {str(e)}")
         
         # Method 3: MaxApertureValue
         max_aperture, _ = self.extract_setting(exif_data, 'MaxApertureValue', 'aperture')
         if max_aperture is not None:
             try:
-                max_f_stop = 2 ** (max_aperture / 2)
+                max_f_stop = _apex_aperture(max_aperture)
+                if not math.isfinite(max_f_stop):
+                    raise OverflowError("result out of range")
                 aperture_results['MaxApertureValue'] = max_f_stop
-                self._print(f"     Max aperture: {self.converter.format_aperture(max_f_stop)}")
-            except Exception as e:
+                if self.verbose:
+                    self._print(f"     Max aperture: {self.converter.format_aperture(max_f_stop)}")
+            except (OverflowError, TypeError) as e:
                 self._print(f"     ❌ Max aperture calculation failed: {str(e)}")
         
         if not aperture_results:
@@ -264,18 +453,22 @@ class CameraSettingsExtractor:
         exposure_time, _ = self.extract_setting(exif_data, 'ExposureTime', 'shutter')
         if exposure_time is not None:
             shutter_results['ExposureTime'] = exposure_time
-            self._print(f"     Decimal seconds: {exposure_time:.6f}")
-            self._print(f"     Display format: {self.converter.format_shutter_speed(exposure_time)}")
+            if self.verbose:
+                self._print(f"     Decimal seconds: {exposure_time:.6f}")
+                self._print(f"     Display format: {self.converter.format_shutter_speed(exposure_time)}")
         
         # Method 2: ShutterSpeedValue (APEX system)
         apex_value, _ = self.extract_setting(exif_data, 'ShutterSpeedValue', 'shutter')
         if apex_value is not None:
             try:
-                calculated_time = 2 ** (-apex_value)
+                calculated_time = _apex_shutter(apex_value)
+                if not math.isfinite(calculated_time):
+                    raise OverflowError("result out of range")
                 shutter_results['ShutterSpeedValue'] = calculated_time
-                self._print(f"     APEX calculation: 2^(-{apex_value}) = {calculated_time:.6f}s")
-                self._print(f"     Display format: {self.converter.format_shutter_speed(calculated_time)}")
-            except Exception as e:
+                if self.verbose:
+                    self._print(f"     APEX calculation: 2^(-{apex_value}) = {calculated_time:.6f}s")
+                    self._print(f"     Display format: {self.converter.format_shutter_speed(calculated_time)}")
+            except (OverflowError, TypeError) as e:
                 self._print(f"     ❌ APEX calculation failed: {str(e)}")
         
         if not shutter_results:
@@ -288,34 +481,32 @@ class CameraSettingsExtractor:
         self._print("\n📊 ISO EXTRACTION:")
         iso_results = {}
         
-        # List of ISO tags to check
-        iso_tags = [
-            'ISOSpeedRatings',
-            'ISO', 
-            'RecommendedExposureIndex',
-            'PhotographicSensitivity'
-        ]
-        
-        for tag in iso_tags:
+        for tag in _ISO_TAGS:
             if tag in exif_data:
                 raw_value = exif_data[tag]
-                self._print(f"  ✅ {tag} found: {raw_value} (type: {type(raw_value)})")
+                if self.verbose:
+                    self._print(f"  ✅ {tag} found: {raw_value} (type: {type(raw_value)})")
                 
                 # Handle array/tuple of ISO values
                 if isinstance(raw_value, (list, tuple)):
-                    self._print(f"     Multiple values found: {raw_value}")
+                    if self.verbose:
+                        self._print(f"     Multiple values found: {raw_value}")
                     if len(raw_value) > 0:
-                        iso_value, conversion_info = self.converter.to_float(raw_value[0], f"{tag}[0]")
-                        self._print(f"     Using first value - Conversion: {conversion_info}")
+                        iso_value, conversion_info = self._to_float(raw_value[0], f"{tag}[0]")
+                        if self.verbose:
+                            self._print(f"     Using first value - Conversion: {conversion_info}")
                         if iso_value is not None:
                             iso_results[tag] = iso_value
-                            self._print(f"     Final: {self.converter.format_iso(iso_value)}")
+                            if self.verbose:
+                                self._print(f"     Final: {self.converter.format_iso(iso_value)}")
                 else:
-                    iso_value, conversion_info = self.converter.to_float(raw_value, tag)
-                    self._print(f"     Conversion: {conversion_info}")
+                    iso_value, conversion_info = self._to_float(raw_value, tag)
+                    if self.verbose:
+                        self._print(f"     Conversion: {conversion_info}")
                     if iso_value is not None:
                         iso_results[tag] = iso_value
-                        self._print(f"     Final: {self.converter.format_iso(iso_value)}")
+                        if self.verbose:
+                            self._print(f"     Final: {self.converter.format_iso(iso_value)}")
         
         if not iso_results:
             self._print("  ❌ No usable ISO data found")
@@ -331,13 +522,15 @@ class CameraSettingsExtractor:
         focal_value, _ = self.extract_setting(exif_data, 'FocalLength', 'focal_length')
         if focal_value is not None:
             focal_results['FocalLength'] = focal_value
-            self._print(f"     Final focal length: {focal_value:.1f}mm")
+            if self.verbose:
+                self._print(f"     Final focal length: {focal_value:.1f}mm")
         
         # 35mm equivalent focal length
         focal_35mm, _ = self.extract_setting(exif_data, 'FocalLengthIn35mmFilm', 'focal_length_35mm')
         if focal_35mm is not None:
             focal_results['FocalLengthIn35mmFilm'] = focal_35mm
-            self._print(f"     35mm equivalent: {focal_35mm:.1f}mm")
+            if self.verbose:
+                self._print(f"     35mm equivalent: {focal_35mm:.1f}mm")
         
         if not focal_results:
             self._print("  ❌ No focal length data found")
@@ -349,25 +542,10 @@ class CameraSettingsExtractor:
         self._print("\n💡 EXPOSURE INFO EXTRACTION:")
         exposure_results = {}
         
-        exposure_fields = {
-            'ExposureMode': 'Exposure Mode',
-            'ExposureProgram': 'Exposure Program',
-            'ExposureBiasValue': 'Exposure Bias',
-            'MeteringMode': 'Metering Mode',
-            'LightSource': 'Light Source',
-            'Flash': 'Flash',
-            'WhiteBalance': 'White Balance',
-            'SceneCaptureType': 'Scene Type',
-            'GainControl': 'Gain Control',
-            'Contrast': 'Contrast',
-            'Saturation': 'Saturation',
-            'Sharpness': 'Sharpness'
-        }
-        
-        for tag, description in exposure_fields.items():
+        for tag, description in _EXPOSURE_FIELDS.items():
             if tag in exif_data:
                 raw_value = exif_data[tag]
-                numeric_value, _ = self.converter.to_float(raw_value, tag)
+                numeric_value, _ = self._to_float(raw_value, tag)
                 
                 # Decode special values
                 decoded_value = raw_value
@@ -384,7 +562,8 @@ class CameraSettingsExtractor:
                     'decoded': decoded_value
                 }
                 
-                self._print(f"  {description:20}: {raw_value} → {decoded_value}")
+                if self.verbose:
+                    self._print(f"  {description:20}: {raw_value} → {decoded_value}")
         
         return exposure_results
     
@@ -392,42 +571,69 @@ class CameraSettingsExtractor:
         """Extract additional camera information"""
         self._print("\n📸 ADDITIONAL CAMERA INFO:")
         
-        text_fields = {
-            'Make': 'Camera Make',
-            'Model': 'Camera Model', 
-            'LensModel': 'Lens Model',
-            'LensMake': 'Lens Make',
-            'Software': 'Software',
-            'DateTime': 'Date/Time',
-            'DateTimeOriginal': 'Original Date/Time',
-            'DateTimeDigitized': 'Digitized Date/Time',
-            'Artist': 'Artist',
-            'Copyright': 'Copyright',
-            'ImageDescription': 'Description'
-        }
-        
         results = {}
         
         # Extract text fields
-        for tag, description in text_fields.items():
+        for tag, description in _TEXT_FIELDS.items():
             if tag in exif_data:
                 value = exif_data[tag]
                 if tag in ['DateTime', 'DateTimeOriginal', 'DateTimeDigitized']:
                     formatted_value = self.converter.format_datetime(value)
                     results[tag] = {'raw': value, 'formatted': formatted_value}
-                    self._print(f"  {description:25}: {formatted_value}")
+                    if self.verbose:
+                        self._print(f"  {description:25}: {formatted_value}")
                 else:
                     results[tag] = value
-                    self._print(f"  {description:25}: {value}")
+                    if self.verbose:
+                        self._print(f"  {description:25}: {value}")
         
         return results
 
+def _rational_parts(component):
+    """Split one EXIF rational (IFDRational, (num, den) pair or plain number) into floats"""
+    try:
+        if isinstance(component, IFDRational):
+            return float(component.numerator), float(component.denominator)
+        if isinstance(component, (list, tuple)):
+            return float(component[0]), float(component[1])
+        if component is None:
+            return np.nan, 1.0
+        return float(component), 1.0
+    except (TypeError, ValueError, IndexError):
+        return np.nan, 1.0
+
+def _dms_parts(coord_value):
+    """Degree/minute/second numerators and denominators as a flat 6-tuple"""
+    if isinstance(coord_value, (list, tuple)) and len(coord_value) >= 3:
+        return (*_rational_parts(coord_value[0]), *_rational_parts(coord_value[1]),
+                *_rational_parts(coord_value[2]))
+    return (*_rational_parts(coord_value), 0.0, 1.0, 0.0, 1.0)
+
+def _dms_to_decimal(dn, dd, mn, md, sn, sd):
+    """Decimal degrees from degree/minute/second numerators and denominators"""
+    return dn / dd + mn / (60.0 * md) + sn / (3600.0 * sd)
+
+def _apex_aperture(apex_value):
+    """f-number from an APEX aperture value"""
+    return 2.0 ** (apex_value / 2.0)
+
+def _apex_shutter(apex_value):
+    """Exposure time in seconds from an APEX shutter speed value"""
+    return 2.0 ** (-apex_value)
+
+def _dms_to_degrees(parts):
+    """Decimal degrees for each row of an (N, 6) DMS numerator/denominator array"""
+    return (parts[:, 0] / parts[:, 1] + parts[:, 2] / (60.0 * parts[:, 3])
+            + parts[:, 4] / (3600.0 * parts[:, 5]))
+
 class GPSExtractor:
     """Specialized class for GPS data extraction and conversion"""
     
-    def __init__(self, verbose=True):
+    def __init__(self, verbose=True, convert_coordinates=True):
         self.converter = ExifValueConverter()
         self.verbose = verbose
+        # Batch callers turn this off and convert all images at once with convert_gps_batch
+        self.convert_coordinates = convert_coordinates
     
     def _print(self, message):
         """Print message only if verbose mode is enabled"""
@@ -444,23 +650,59 @@ class GPSExtractor:
         
         # Extract all GPS tags
         for gps_tag_id, gps_val in gps_value.items():
-            gps_tag_name = GPSTAGS.get(gps_tag_id, f"GPS_Unknown_{gps_tag_id}")
+            gps_tag_name = _GPS_TAG_NAME.get(gps_tag_id) or f"GPS_Unknown_{gps_tag_id}"
             gps_data[gps_tag_name] = gps_val
-            self._print(f"    {gps_tag_name:20}: {gps_val}")
+            if self.verbose:
+                self._print(f"    {gps_tag_name:20}: {gps_val}")
         
         # Convert coordinates to decimal if possible
-        coordinates = self.convert_gps_to_decimal(gps_data)
-        if coordinates['latitude'] is not None and coordinates['longitude'] is not None:
-            gps_data['decimal_coordinates'] = coordinates
-            self._print(f"    {'Decimal Coords':20}: {coordinates['latitude']:.6f}, {coordinates['longitude']:.6f}")
-            
-            # Generate map links
-            map_links = self.generate_map_links(coordinates['latitude'], coordinates['longitude'])
-            gps_data['map_links'] = map_links
-            self._print(f"    {'Google Maps':20}: {map_links['google']}")
+        if self.convert_coordinates:
+            self.add_decimal_coordinates(gps_data, self.convert_gps_to_decimal(gps_data))
         
         return gps_data
     
+    def add_decimal_coordinates(self, gps_data, coordinates):
+        """Attach decimal coordinates and map links when both latitude and longitude are known"""
+        if coordinates['latitude'] is None or coordinates['longitude'] is None:
+            return
+        
+        gps_data['decimal_coordinates'] = coordinates
+        if self.verbose:
+            self._print(f"    {'Decimal Coords':20}: {coordinates['latitude']:.6f}, {coordinates['longitude']:.6f}")
+        
+        # Generate map links
+        map_links = self.generate_map_links(coordinates['latitude'], coordinates['longitude'])
+        gps_data['map_links'] = map_links
+        if self.verbose:
+            self._print(f"    {'Google Maps':20}: {map_links['google']}")
+    
+    def convert_gps_batch(self, gps_infos):
+        """
+        Convert many GPS tag dicts to decimal degrees in one NumPy pass
+        Returns: (N, 3) float array of latitude, longitude, altitude (NaN where unavailable)
+        """
+        n = len(gps_infos)
+        lat = np.array([_dms_parts(info.get('GPSLatitude')) for info in gps_infos],
+                       dtype=np.float64).reshape(n, 6)
+        lon = np.array([_dms_parts(info.get('GPSLongitude')) for info in gps_infos],
+                       dtype=np.float64).reshape(n, 6)
+        alt = np.array([_rational_parts(info.get('GPSAltitude')) for info in gps_infos],
+                       dtype=np.float64).reshape(n, 2)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            coords = np.column_stack([_dms_to_degrees(lat), _dms_to_degrees(lon), alt[:, 0] / alt[:, 1]])
+        coords[~np.isfinite(coords)] = np.nan
+        
+        # Apply direction references (south/west/below sea level)
+        south = np.array([info.get('GPSLatitudeRef') == 'S' for info in gps_infos], dtype=bool)
+        west = np.array([info.get('GPSLongitudeRef') == 'W' for info in gps_infos], dtype=bool)
+        below = np.array([info.get('GPSAltitudeRef') in (1, b'\x01') for info in gps_infos], dtype=bool)
+        coords[south, 0] *= -1
+        coords[west, 1] *= -1
+        coords[below, 2] *= -1
+        
+        return coords
+    
     def convert_gps_to_decimal(self, gps_info):
         """Convert GPS coordinates to decimal degrees with robust error handling"""
         result = {'latitude': None, 'longitude': None, 'altitude': None}
@@ -476,11 +718,10 @@ class GPSExtractor:
             try:
                 if isinstance(coord_value, (list, tuple)) and len(coord_value) >= 3:
                     # Handle fractions in GPS coordinates
-                    degrees = float(coord_value[0]) if isinstance(coord_value[0], (int, float)) else float(coord_value[0][0]) / float(coord_value[0][1])
-                    minutes = float(coord_value[1]) if isinstance(coord_value[1], (int, float)) else float(coord_value[1][0]) / float(coord_value[1][1])
-                    seconds = float(coord_value[2]) if isinstance(coord_value[2], (int, float)) else float(coord_value[2][0]) / float(coord_value[2][1])
-                    
-                    return degrees + (minutes / 60.0) + (seconds / 3600.0)
+                    decimal = _dms_to_decimal(*_dms_parts(coord_value))
+                    if decimal != decimal:
+                        raise ValueError(f"non-numeric component in {coord_value}")
+                    return decimal
                 else:
                     return float(coord_value)
             except (ValueError, TypeError, ZeroDivisionError) as e:
@@ -510,7 +751,7 @@ class GPSExtractor:
             alt = convert_coordinate(gps_info['GPSAltitude'])
             if alt is not None:
                 # Apply reference (above/below sea level)
-                if gps_info.get('GPSAltitudeRef') == 1:  # Below sea level
+                if gps_info.get('GPSAltitudeRef') in (1, b'\x01'):  # Below sea level
                     alt = -alt
                 result['altitude'] = alt
         
@@ -525,12 +766,54 @@ class GPSExtractor:
             'apple': f"https://maps.apple.com/?q={lat},{lon}"
         }
 
+def _file_stamp(image_path):
+    """(absolute path, (mtime_ns, size)) identifying a file's current contents, or None"""
+    try:
+        st = os.stat(image_path)
+    except OSError:
+        return None
+    return os.path.abspath(image_path), (st.st_mtime_ns, st.st_size)
+
+def _open_cache(cache_path):
+    """Open the analysis cache, or return None (with a warning) if it can't be used"""
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        return shelve.open(cache_path)
+    except (OSError, dbm.error) as e:
+        print(f"⚠️ Could not open cache {cache_path}: {str(e)}")
+        return None
+
+def _read_header(image_path):
+    """First JPEG_HEADER_BYTES of a file, or None if it can't be read"""
+    try:
+        with open(image_path, 'rb') as f:
+            return f.read(JPEG_HEADER_BYTES)
+    except OSError:
+        return None
+
+def _prefetch_headers(paths, depth):
+    """Yield (path, header) in order while up to depth further reads run ahead on threads"""
+    with ThreadPoolExecutor(max_workers=depth) as pool:
+        in_flight = deque()
+        for path in paths:
+            in_flight.append((path, pool.submit(_read_header, path)))
+            if len(in_flight) >= depth:
+                ready_path, future = in_flight.popleft()
+                yield ready_path, future.result()
+        while in_flight:
+            ready_path, future = in_flight.popleft()
+            yield ready_path, future.result()
+
+def _analyze_one(image_path):
+    """Analyze a single image in a worker process (verbose off so output is not interleaved)"""
+    return ExifAnalyzer(verbose=False, convert_gps=False).analyze_image(image_path)
+
 class ExifAnalyzer:
     """Main class for comprehensive EXIF analysis"""
     
-    def __init__(self, verbose=True):
+    def __init__(self, verbose=True, convert_gps=True):
         self.settings_extractor = CameraSettingsExtractor(verbose)
-        self.gps_extractor = GPSExtractor(verbose)
+        self.gps_extractor = GPSExtractor(verbose, convert_coordinates=convert_gps)
         self.converter = ExifValueConverter()
         self.verbose = verbose
     
@@ -539,30 +822,30 @@ class ExifAnalyzer:
         if self.verbose:
             print(message)
     
-    def analyze_image(self, image_path):
-        """Perform complete EXIF analysis on an image"""
+    def analyze_image(self, image_path, header=None):
+        """Perform complete EXIF analysis on an image (header: prefetched leading bytes, if any)"""
         image_path = Path(image_path)
         
-        if not image_path.exists():
+        # One stat serves the existence check and both file-size uses below
+        try:
+            file_size = os.stat(image_path).st_size
+        except OSError:
             self._print(f"❌ File not found: {image_path}")
             return None
         
         try:
-            with Image.open(image_path) as img:
+            with self._open_image(image_path, header) as img:
                 # Basic image info
-                self._print(f"📸 Image: {image_path.name}")
-                self._print(f"📏 Size: {img.size}")
-                self._print(f"🎨 Format: {img.format}")
-                self._print(f"🔧 Mode: {img.mode}")
+                if self.verbose:
+                    self._print(f"📸 Image: {image_path.name}")
+                    self._print(f"📏 Size: {img.size}")
+                    self._print(f"🎨 Format: {img.format}")
+                    self._print(f"🔧 Mode: {img.mode}")
                 
-                # Try to get file size
-                try:
-                    file_size = image_path.stat().st_size
+                if self.verbose:
                     self._print(f"💾 File Size: {self.format_file_size(file_size)}")
-                except:
-                    pass
                 
-                exif_data = img.getexif()
+                exif_data = img.getexif() if img.format in EXIF_CAPABLE_FORMATS else {}
                 
                 if not exif_data:
                     self._print("❌ No EXIF data found in this image")
@@ -572,18 +855,20 @@ class ExifAnalyzer:
                             'size': img.size,
                             'format': img.format,
                             'mode': img.mode,
-                            'file_size': getattr(image_path.stat(), 'st_size', None)
+                            'file_size': file_size
                         },
                         'has_exif': False
                     }
                 
-                self._print(f"✅ Found {len(exif_data)} EXIF tags")
+                if self.verbose:
+                    self._print(f"✅ Found {len(exif_data)} EXIF tags")
                 
                 # Convert to readable format
-                readable_exif = {}
-                for tag_id, value in exif_data.items():
-                    tag_name = TAGS.get(tag_id, f"Unknown_{tag_id}")
-                    readable_exif[tag_name] = value
+                tag_names = _TAG_NAME
+                readable_exif = {
+                    tag_names.get(tag_id) or f"Unknown_{tag_id}": value
+                    for tag_id, value in exif_data.items()
+                }
                 
                 # Analyze camera settings
                 camera_analysis = self.analyze_camera_settings(readable_exif)
@@ -591,7 +876,8 @@ class ExifAnalyzer:
                 # Extract GPS data
                 gps_data = None
                 if 'GPSInfo' in readable_exif:
-                    gps_data = self.gps_extractor.extract_gps_info(readable_exif['GPSInfo'])
+                    # The top-level GPSInfo tag is only the IFD offset; read the IFD itself
+                    gps_data = self.gps_extractor.extract_gps_info(exif_data.get_ifd(IFD.GPSInfo))
                 
                 # Show all EXIF tags if verbose
                 if self.verbose:
@@ -603,7 +889,7 @@ class ExifAnalyzer:
                         'size': img.size,
                         'format': img.format,
                         'mode': img.mode,
-                        'file_size': getattr(image_path.stat(), 'st_size', None)
+                        'file_size': file_size
                     },
                     'has_exif': True,
                     'camera_analysis': camera_analysis,
@@ -615,18 +901,108 @@ class ExifAnalyzer:
             self._print(f"❌ Error reading image: {str(e)}")
             return None
     
+    def _open_image(self, image_path, head=None):
+        """Open an image, parsing JPEGs from their header prefix instead of the whole file"""
+        if head is None:
+            with open(image_path, 'rb') as f:
+                head = f.read(JPEG_HEADER_BYTES)
+        
+        if head[:2] == b'\xff\xd8':
+            try:
+                img = Image.open(io.BytesIO(head))
+                img.getexif()
+                return img
+            except Exception:
+                # Header runs past the prefix; fall back to the full file
+                pass
+        
+        return Image.open(image_path)
+    
+    @classmethod
+    def analyze_directory(cls, paths, num_workers=None, cache_path=None):
+        """
+        Analyze many images across a process pool; results are returned in input order
+        With cache_path, files unchanged since their cached analysis (same mtime and size)
+        are not re-parsed
+        """
+        paths = list(paths)
+        results = [None] * len(paths)
+        stamps = [_file_stamp(path) for path in paths]
+        
+        cache = _open_cache(cache_path) if cache_path else None
+        if cache is not None:
+            for index, stamp in enumerate(stamps):
+                entry = cache.get(f"{ANALYZER_VERSION}:{stamp[0]}") if stamp else None
+                if entry is not None and entry[0] == stamp[1]:
+                    results[index] = entry[1]
+        
+        pending = [index for index, result in enumerate(results) if result is None]
+        pending_paths = [paths[index] for index in pending]
+        
+        workers = num_workers or os.cpu_count() or 1
+        if workers == 1 or len(pending_paths) < 2:
+            # Single process: read the next files' headers on I/O threads while this one parses
+            analyzer = cls(verbose=False, convert_gps=False)
+            depth = min((os.cpu_count() or 1) * 4, 64)
+            fresh = [analyzer.analyze_image(path, header)
+                     for path, header in _prefetch_headers(pending_paths, depth)]
+        else:
+            chunksize = max(1, len(pending_paths) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                fresh = list(executor.map(_analyze_one, pending_paths, chunksize=chunksize))
+        
+        # Convert every image's GPS coordinates together instead of one at a time
+        gps_results = [r['gps_data'] for r in fresh if r and r.get('gps_data')]
+        if gps_results:
+            gps_extractor = GPSExtractor(verbose=False)
+            coords = gps_extractor.convert_gps_batch(gps_results)
+            for gps_data, (lat, lon, alt) in zip(gps_results, coords.tolist()):
+                gps_extractor.add_decimal_coordinates(gps_data, {
+                    'latitude': None if np.isnan(lat) else lat,
+                    'longitude': None if np.isnan(lon) else lon,
+                    'altitude': None if np.isnan(alt) else alt,
+                })
+        
+        for index, result in zip(pending, fresh):
+            results[index] = result
+            # One entry per path, so edited files replace their old entry
+            if cache is not None and result is not None and stamps[index] is not None:
+                path_key, stat_key = stamps[index]
+                cache[f"{ANALYZER_VERSION}:{path_key}"] = (stat_key, result)
+        
+        if cache is not None:
+            cache.close()
+        
+        return results
+    
     def analyze_camera_settings(self, exif_data):
         """Analyze all camera settings"""
         self._print("\n📷 CAMERA SETTINGS ANALYSIS")
         self._print("=" * 50)
         
+        # Route the relevant tags to their sections in a single walk of the EXIF dict, so each
+        # extractor probes only its own few tags
+        extractor = self.settings_extractor
+        sections = {
+            'aperture': {},
+            'shutter_speed': {},
+            'iso': {},
+            'focal_length': {},
+            'exposure_info': {},
+            'additional_info': {},
+        }
+        for tag_name, value in exif_data.items():
+            section = _SETTING_SECTIONS.get(tag_name)
+            if section is not None:
+                sections[section][tag_name] = value
+        
         results = {}
-        results['aperture'] = self.settings_extractor.extract_aperture(exif_data)
-        results['shutter_speed'] = self.settings_extractor.extract_shutter_speed(exif_data)
-        results['iso'] = self.settings_extractor.extract_iso(exif_data)
-        results['focal_length'] = self.settings_extractor.extract_focal_length(exif_data)
-        results['exposure_info'] = self.settings_extractor.extract_exposure_info(exif_data)
-        results['additional_info'] = self.settings_extractor.extract_additional_info(exif_data)
+        results['aperture'] = extractor.extract_aperture(sections['aperture'])
+        results['shutter_speed'] = extractor.extract_shutter_speed(sections['shutter_speed'])
+        results['iso'] = extractor.extract_iso(sections['iso'])
+        results['focal_length'] = extractor.extract_focal_length(sections['focal_length'])
+        results['exposure_info'] = extractor.extract_exposure_info(sections['exposure_info'])
+        results['additional_info'] = extractor.extract_additional_info(sections['additional_info'])
         
         return results
     
@@ -635,20 +1011,33 @@ class ExifAnalyzer:
         self._print(f"\n📋 ALL EXIF TAGS ({len(exif_data)} total)")
         self._print("=" * 50)
         
-        for tag_name, value in sorted(exif_data.items()):
-            if tag_name != 'GPSInfo':  # GPS is handled separately
-                self.display_generic_tag(tag_name, value)
+        # Format every line first and emit them with a single write
+        lines = [
+            self.format_generic_tag(tag_name, value)
+            for tag_name, value in sorted(exif_data.items())
+            if tag_name != 'GPSInfo'  # GPS is handled separately
+        ]
+        if lines:
+            self._print('\n'.join(lines))
     
-    def display_generic_tag(self, tag_name, value):
-        """Display a generic EXIF tag"""
+    def format_generic_tag(self, tag_name, value):
+        """Format a generic EXIF tag as a display line"""
         if isinstance(value, bytes):
             display_value = f"<bytes: {len(value)} bytes>"
-        elif isinstance(value, (list, tuple)) and len(str(value)) > 80:
-            display_value = f"<{type(value).__name__}: {len(value)} items>"
         else:
-            display_value = str(value)[:80] + "..." if len(str(value)) > 80 else value
+            text = str(value)
+            if len(text) <= 80:
+                display_value = text
+            elif isinstance(value, (list, tuple)):
+                display_value = f"<{type(value).__name__}: {len(value)} items>"
+            else:
+                display_value = text[:80] + "..."
         
-        self._print(f"{tag_name:30}: {display_value}")
+        return f"{tag_name:30}: {display_value}"
+    
+    def display_generic_tag(self, tag_name, value):
+        """Display a generic EXIF tag"""
+        self._print(self.format_generic_tag(tag_name, value))
     
     def format_file_size(self, size_bytes):
         """Format file size in human-readable format"""
@@ -656,10 +1045,9 @@ class ExifAnalyzer:
             return "0 B"
         
         size_names = ["B", "KB", "MB", "GB"]
-        import math
-        i = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2)
+        # Each unit is 2**10 of the previous one, so the bit length picks the unit
+        i = max(0, min(3, (size_bytes.bit_length() - 1) // 10))
+        s = round(size_bytes / (1 << (i * 10)), 2)
         return f"{s} {size_names[i]}"
     
     def generate_summary(self, analysis_results):
@@ -726,6 +1114,37 @@ class ExifAnalyzer:
         
         return '\n'.join(summary)
 
+def _json_default(value):
+    """Serialize EXIF rationals as numbers and anything else JSON can't encode as text"""
+    if isinstance(value, IFDRational):
+        return float(value)
+    return str(value)
+
+def save_results(all_results, output_path):
+    """Write results as one JSON document, or one line per image for .ndjson/.jsonl paths"""
+    streaming = Path(output_path).suffix.lower() in ('.ndjson', '.jsonl')
+    
+    if orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        with open(output_path, 'wb') as f:
+            if streaming:
+                for image_path, results in all_results.items():
+                    f.write(orjson.dumps({'image': image_path, **results}, option=options,
+                                         default=_json_default))
+                    f.write(b'\n')
+            else:
+                f.write(orjson.dumps(all_results, option=options | orjson.OPT_INDENT_2,
+                                     default=_json_default))
+        return
+    
+    with open(output_path, 'w') as f:
+        if streaming:
+            for image_path, results in all_results.items():
+                f.write(json.dumps({'image': image_path, **results}, default=_json_default))
+                f.write('\n')
+        else:
+            json.dump(all_results, f, indent=2, default=_json_default)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Comprehensive EXIF data extraction and analysis tool",
@@ -734,15 +1153,23 @@ def main():
 Examples:
   python exif_analyzer.py photo.jpg
   python exif_analyzer.py --quiet --output analysis.json photo.jpg
+  python exif_analyzer.py --quiet --output analysis.ndjson *.jpg
   python exif_analyzer.py --summary-only *.jpg
         """
     )
     
     parser.add_argument('images', nargs='+', help='Image file(s) to analyze')
-    parser.add_argument('--output', '-o', help='Save complete analysis to JSON file')
+    parser.add_argument('--output', '-o',
+                        help='Save complete analysis to JSON file (.ndjson/.jsonl: one line per image)')
     parser.add_argument('--quiet', '-q', action='store_true', help='Suppress verbose output')
     parser.add_argument('--summary-only', '-s', action='store_true', help='Show only summary information')
     parser.add_argument('--no-gps', action='store_true', help='Skip GPS data extraction')
+    parser.add_argument('--workers', '-w', type=int, default=os.cpu_count(),
+                        help='Worker processes for batch analysis in quiet/summary mode (default: CPU count)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse analyses of unchanged files in quiet/summary mode')
+    parser.add_argument('--cache-path', default=CACHE_PATH,
+                        help='Analysis cache used with --cache (default: ~/.cache/photo-tools/)')
     
     args = parser.parse_args()
     
@@ -755,12 +1182,21 @@ Examples:
     analyzer = ExifAnalyzer(verbose=not args.quiet)
     all_results = {}
     
-    for image_path in args.images:
+    # Verbose output is per image, so only quiet runs are batched (process pool and cache)
+    batch_results = None
+    if args.quiet:
+        batch_results = ExifAnalyzer.analyze_directory(
+            args.images, args.workers, cache_path=args.cache_path if args.cache else None)
+    
+    for index, image_path in enumerate(args.images):
         try:
             if not args.quiet:
                 print(f"\n{'='*60}")
             
-            results = analyzer.analyze_image(image_path)
+            if batch_results is not None:
+                results = batch_results[index]
+            else:
+                results = analyzer.analyze_image(image_path)
             
             if results:
                 all_results[image_path] = results
@@ -771,7 +1207,7 @@ Examples:
                     print(f"\n✅ Analysis completed successfully!")
                     
                     # Quick summary
-                    camera_analysis = results['camera_analysis']
+                    camera_analysis = results.get('camera_analysis', {})
                     total_settings = sum(len(settings) for settings in camera_analysis.values() if isinstance(settings, dict))
                     print(f"📊 Total EXIF tags: {len(results.get('all_exif', {}))}")
                     print(f"📷 Camera settings extracted: {total_settings}")
@@ -791,8 +1227,7 @@ Examples:
     # Save results if requested
     if args.output and all_results:
         try:
-            with open(args.output, 'w') as f:
-                json.dump(all_results, f, indent=2, default=str)
+            save_results(all_results, args.output)
             print(f"\n💾 Complete analysis saved to: {args.output}")
         except Exception as e:
             print(f"⚠️ Could not save JSON file: {str(e)}")
@@ -1,60 +1,570 @@
 import os
+import io
+import csv
+import sys
+import struct
+import dbm
+import logging
+import shelve
+import numpy as np
 import pandas as pd
 import PIL.Image
-from PIL.ExifTags import TAGS, GPSTAGS
+from PIL.ExifTags import TAGS, GPS
+from PIL.TiffImagePlugin import IFDRational
 import json
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
 import plotly.graph_objects as go
 
+# Optional RAW support: exifread reads the TIFF-based RAW headers without decoding pixels
+try:
+    import exifread
+except ImportError:
+    exifread = None
+
+# Optional Arrow CSV writer; pandas' to_csv is used when it is missing
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# A JPEG's APP1 EXIF segment is capped at 64 KB and sits at the start of the file
+JPEG_HEADER_BYTES = 64 * 1024
+
+# Files smaller than this cannot contain a usable EXIF header
+MIN_PHOTO_BYTES = 4 * 1024
+
+# Persistent per-file record cache, keyed by extractor version and absolute path
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "photo_analyzer", "exif.db")
+
+# Bump whenever extraction changes the values it records, so older cache entries are ignored
+EXTRACTOR_VERSION = 1
+
+# RAW extensions handled through exifread when it is installed
+RAW_FORMATS = (".cr2", ".nef", ".arw", ".dng", ".raf")
+
+# exifread "IFD Tag" keys for the wanted tags, with the Pillow-style names used downstream
+EXIFREAD_TAGS = (
+    ("EXIF FNumber", "FNumber"),
+    ("EXIF ApertureValue", "ApertureValue"),
+    ("EXIF ExposureTime", "ExposureTime"),
+    ("EXIF ISOSpeedRatings", "ISOSpeedRatings"),
+    ("EXIF FocalLength", "FocalLength"),
+    ("Image Model", "Model"),
+    ("Image Make", "Make"),
+    ("EXIF LensModel", "LensModel"),
+    ("Image DateTime", "DateTime"),
+)
+EXIFREAD_GPS_TAGS = (
+    ("GPS GPSLatitudeRef", "GPSLatitudeRef"),
+    ("GPS GPSLatitude", "GPSLatitude"),
+    ("GPS GPSLongitudeRef", "GPSLongitudeRef"),
+    ("GPS GPSLongitude", "GPSLongitude"),
+)
+
+# Tags read by parse_camera_settings and the GPS lookup; everything else is skipped
+WANTED_TAGS = {
+    "FNumber",
+    "ApertureValue",
+    "ExposureTime",
+    "ISOSpeedRatings",
+    "ISO",
+    "FocalLength",
+    "Model",
+    "Make",
+    "LensModel",
+    "DateTime",
+    "GPSInfo",
+}
+
+# Per-photo values emitted by the extraction workers; derived columns are computed over
+# the whole collection in PhotoMetadataAnalyzer.records_to_dataframe
+RAW_FIELDS = (
+    "filename",
+    "filepath",
+    "file_size",
+    "FNumber",
+    "ApertureValue",
+    "ExposureTime",
+    "ISO",
+    "FocalLength",
+    "Model",
+    "Make",
+    "LensModel",
+    "DateTime",
+    "GPSLatitude",
+    "GPSLatitudeRef",
+    "GPSLongitude",
+    "GPSLongitudeRef",
+)
+
+
+def _to_float(value):
+    """Convert an EXIF number (usually an IFDRational) to float, or None"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+
+
+def _dms_to_deg(value):
+    """Convert an EXIF degrees/minutes/seconds triple to decimal degrees"""
+    return value[0] + value[1] / 60.0 + value[2] / 3600.0
+
+
+def _intern(value):
+    """Intern repeated EXIF strings so a pool chunk pickles each distinct value once"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _exifread_value(tag):
+    """Plain value of an exifread tag: strings as-is, single-element lists unwrapped"""
+    values = tag.values
+    if isinstance(values, list):
+        return values[0] if len(values) == 1 else tuple(values)
+    return values
+
+
+def _dms_tuple(value):
+    """Convert an EXIF degrees/minutes/seconds triple to a tuple of floats, or None"""
+    try:
+        return (float(value[0]), float(value[1]), float(value[2]))
+    except (TypeError, ValueError, IndexError, ZeroDivisionError):
+        return None
+
+
+def _with_progress(results, progress, done, total):
+    """Yield results in order, calling progress(done, total) after each one"""
+    for result in results:
+        done += 1
+        progress(done, total)
+        yield result
+
+
+def iter_image_files(root, recursive, extensions, min_bytes=0):
+    """Yield (path, size) for each image under root in one directory walk, ignoring case
+
+    Files smaller than min_bytes are skipped before any EXIF I/O. The size is passed on to
+    the extraction workers so they don't stat each file again.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from iter_image_files(entry.path, recursive, extensions, min_bytes)
+            elif entry.name.lower().endswith(extensions) and entry.is_file():
+                size = entry.stat().st_size
+                if size >= min_bytes:
+                    yield Path(entry.path), size
+
+
+def _seconds_timestamps(table):
+    """table with timestamp columns truncated to whole seconds, as pandas' to_csv writes them"""
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type) and field.type.unit != "s":
+            column = table.column(i).cast(pa.timestamp("s", tz=field.type.tz), safe=False)
+            table = table.set_column(i, field.name, column)
+    return table
+
+
+def _needs_quoting(table):
+    """Whether any string value in table contains a delimiter, quote or line break"""
+    for column in table.columns:
+        for chunk in column.chunks:
+            if pa.types.is_dictionary(chunk.type):
+                chunk = chunk.dictionary
+            if pa.types.is_string(chunk.type) or pa.types.is_large_string(chunk.type):
+                if pc.any(pc.match_substring_regex(chunk, '[",\r\n]')).as_py():
+                    return True
+    return False
+
+
+def write_csv(data, sink):
+    """Write a DataFrame or Arrow table as CSV to a path or binary file object
+
+    Arrow's native writer is used when pyarrow is installed and no value needs quoting. The
+    output matches pandas' to_csv either way: minimal quoting, timestamps to the second.
+    """
+    if pa is not None:
+        table = data
+        if isinstance(data, pd.DataFrame):
+            try:
+                table = pa.Table.from_pandas(data, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed-type object columns can't be converted; let pandas handle them
+                table = None
+        # Arrow quotes every string and header cell unless quoting is off altogether, so
+        # values that do need quotes go through pandas
+        if table is not None and _needs_quoting(table):
+            data = data if isinstance(data, pd.DataFrame) else table.to_pandas()
+        elif table is not None:
+            if isinstance(sink, (str, os.PathLike)):
+                with open(sink, "wb") as f:
+                    write_csv(table, f)
+                return
+            header = io.StringIO()
+            csv.writer(header, lineterminator="\n").writerow(table.column_names)
+            sink.write(header.getvalue().encode("utf-8"))
+            options = pacsv.WriteOptions(include_header=False, quoting_style="none")
+            pacsv.write_csv(_seconds_timestamps(table), sink, options)
+            return
+
+    data.to_csv(sink, index=False)
+
+
+def _file_stamp(path):
+    """(absolute path, (mtime_ns, size)) identifying a file's current contents, or None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), (st.st_mtime_ns, st.st_size)
+
+
+def _open_cache(cache_path):
+    """Open the record cache, or return None (with a warning) if it can't be used"""
+    try:
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        return shelve.open(cache_path)
+    except (OSError, dbm.error) as e:
+        print(f"⚠️  Could not open cache {cache_path}: {str(e)}")
+        return None
+
+
+def _value_counts_dict(series):
+    """series.value_counts().to_dict(), counting categoricals with one np.bincount over the codes"""
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.value_counts().to_dict()
+
+    categories = series.cat.categories
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+    # Most common first; ties keep category order, as value_counts does
+    order = np.argsort(-counts, kind="stable")
+    return {categories[i]: int(counts[i]) for i in order if counts[i]}
+
+
+def _calendar_fields(values):
+    """Hour, month and year of a datetime64 array from two integer casts, like .dt accessors
+
+    Missing timestamps give NaN (and float columns), as .dt.hour etc. do.
+    """
+    hours = values.astype("datetime64[h]").astype(np.int64)
+    months = values.astype("datetime64[M]").astype(np.int64)
+    fields = (hours % 24, months % 12 + 1, months // 12 + 1970)
+
+    missing = np.isnat(values)
+    if missing.any():
+        return tuple(np.where(missing, np.nan, field) for field in fields)
+    return tuple(field.astype(np.int32) for field in fields)
+
+
+def _jpeg_exif_segment(head):
+    """Return the APP1 EXIF payload from a JPEG header prefix, or None if it is not complete"""
+    pos = 2
+    while pos + 4 <= len(head):
+        if head[pos] != 0xFF:
+            return None
+        marker = head[pos + 1]
+        # Start of scan: no metadata segments follow
+        if marker == 0xDA:
+            return None
+        length = int.from_bytes(head[pos + 2 : pos + 4], "big")
+        if marker == 0xE1 and head[pos + 4 : pos + 10] == b"Exif\x00\x00":
+            segment = head[pos + 4 : pos + 2 + length]
+            return segment if len(segment) == length - 2 else None
+        pos += 2 + length
+    return None
+
+
+# IFD0 tags the struct-based parser decodes (all ASCII), and the GPS IFD pointer tag
+_FAST_IFD0_STRINGS = {271: "Make", 272: "Model", 306: "DateTime"}
+_GPS_IFD_POINTER = 34853
+
+# Bytes per value for each TIFF field type Pillow loads
+_TIFF_TYPE_SIZE = {
+    1: 1,
+    2: 1,
+    3: 2,
+    4: 4,
+    5: 8,
+    6: 1,
+    7: 1,
+    8: 2,
+    9: 4,
+    10: 8,
+    11: 4,
+    12: 8,
+    13: 4,
+    16: 8,
+}
+
+
+def _tiff_field(segment, endian, typ, count, field_pos):
+    """Raw bytes of a TIFF field, inline or at its offset, or None if out of range"""
+    size = _TIFF_TYPE_SIZE[typ] * count
+    if size <= 4:
+        return segment[field_pos : field_pos + size]
+    (offset,) = struct.unpack_from(endian + "I", segment, field_pos)
+    # Offsets are relative to the TIFF header, which follows the 6-byte "Exif\0\0" marker
+    data = segment[6 + offset : 6 + offset + size]
+    return data if len(data) == size else None
+
+
+def _tiff_string(data):
+    """Decode an ASCII field the way Pillow does: drop one trailing NUL, latin-1"""
+    if data.endswith(b"\0"):
+        data = data[:-1]
+    return data.decode("latin-1", "replace")
+
+
+def _ifd_entries(segment, endian, ifd_offset):
+    """{tag: (type, count, position of the value field)} for one IFD
+
+    Mirrors Pillow's IFD loader so both parsers see the same tags: entries of unknown type
+    or with no data are skipped, and a truncated entry or value ends the IFD.
+    """
+    pos = 6 + ifd_offset
+    (count,) = struct.unpack_from(endian + "H", segment, pos)
+    entries = {}
+    for i in range(count):
+        entry_pos = pos + 2 + 12 * i
+        if entry_pos + 12 > len(segment):
+            break
+        tag, typ, value_count, offset = struct.unpack_from(endian + "HHII", segment, entry_pos)
+        unit_size = _TIFF_TYPE_SIZE.get(typ)
+        if unit_size is None:
+            continue
+        size = unit_size * value_count
+        if size > 4 and 6 + offset + size > len(segment):
+            break
+        if size == 0:
+            continue
+        entries[tag] = (typ, value_count, entry_pos + 8)
+    return entries
+
+
+def _parse_exif_segment(segment):
+    """Wanted tags from a JPEG APP1 EXIF payload using struct reads, or None to defer to Pillow
+
+    Handles the layout cameras write: ASCII Make/Model/DateTime in IFD0 and rational GPS
+    coordinates. Any other wanted tag, field type or malformed offset returns None, so the
+    result always matches what the Pillow path would produce.
+    """
+    byte_order = segment[6:8]
+    if byte_order == b"II":
+        endian = "<"
+    elif byte_order == b"MM":
+        endian = ">"
+    else:
+        return None
+
+    try:
+        magic, ifd0_offset = struct.unpack_from(endian + "HI", segment, 8)
+        if magic != 42:
+            return None
+        entries = _ifd_entries(segment, endian, ifd0_offset)
+        if not entries:
+            return None
+
+        readable_exif = {}
+        for tag in PhotoMetadataAnalyzer._WANTED_TAG_IDS & entries.keys():
+            typ, count, field_pos = entries[tag]
+            if tag in _FAST_IFD0_STRINGS and typ == 2:
+                data = _tiff_field(segment, endian, typ, count, field_pos)
+                if data is None:
+                    return None
+                readable_exif[_FAST_IFD0_STRINGS[tag]] = _tiff_string(data)
+            elif tag == _GPS_IFD_POINTER and typ in (4, 13) and count == 1:
+                (gps_offset,) = struct.unpack_from(endian + "I", segment, field_pos)
+                gps_info = _parse_gps_ifd(segment, endian, gps_offset)
+                if gps_info is None:
+                    return None
+                readable_exif["GPSInfo"] = gps_info
+            else:
+                return None
+        return readable_exif or None
+    except struct.error:
+        return None
+
+
+def _parse_gps_ifd(segment, endian, ifd_offset):
+    """The four coordinate tags from a GPS IFD, as Pillow would return them, or None"""
+    entries = _ifd_entries(segment, endian, ifd_offset)
+    gps_info = {}
+    for gps_tag_id, name in PhotoMetadataAnalyzer._GPS_TAG_NAME:
+        if gps_tag_id not in entries:
+            continue
+        typ, count, field_pos = entries[gps_tag_id]
+        if name.endswith("Ref"):
+            if typ != 2:
+                return None
+            data = _tiff_field(segment, endian, typ, count, field_pos)
+            if data is None:
+                return None
+            gps_info[name] = _tiff_string(data)
+        else:
+            if typ != 5 or count != 3:
+                return None
+            data = _tiff_field(segment, endian, typ, count, field_pos)
+            if data is None:
+                return None
+            values = struct.unpack(endian + "6I", data)
+            gps_info[name] = tuple(IFDRational(values[i], values[i + 1]) for i in (0, 2, 4))
+    return gps_info
+
+
+@dataclass(slots=True, kw_only=True)
+class Insights:
+    """Collection-level statistics; fields stay None when the source column is missing"""
+
+    camera_usage: dict
+    lens_usage: dict
+    avg_iso: float | None = None
+    iso_distribution: dict | None = None
+    shooting_hours: dict | None = None
+    shooting_months: dict | None = None
+    photos_per_year: dict | None = None
+    gps_enabled_photos: int
+    total_photos: int
+    gps_percentage: float
+
+    def to_dict(self):
+        """Plain dict for JSON export, omitting statistics that were not computed"""
+        values = {f.name: getattr(self, f.name) for f in fields(self)}
+        return {name: value for name, value in values.items() if value is not None}
+
+
+def _extract_one(img_path, file_size=None):
+    """Process-pool entry point: (raw record, error) for one photo, without pickling an analyzer"""
+    return PhotoMetadataAnalyzer()._extract_with_error(img_path, file_size)
+
 
 class PhotoMetadataAnalyzer:
+    _WANTED_TAG_IDS = frozenset(tag_id for tag_id, name in TAGS.items() if name in WANTED_TAGS)
+    _TAG_NAME = {tag_id: TAGS[tag_id] for tag_id in _WANTED_TAG_IDS}
+    _GPS_TAG_NAME = (
+        (GPS.GPSLatitudeRef, "GPSLatitudeRef"),
+        (GPS.GPSLatitude, "GPSLatitude"),
+        (GPS.GPSLongitudeRef, "GPSLongitudeRef"),
+        (GPS.GPSLongitude, "GPSLongitude"),
+    )
+
     def __init__(self):
         self.metadata_cache = {}
+        # (path, error) pairs for the photos the last process_photo_directory call could not read
+        self.last_errors = []
         self.supported_formats = [".jpg", ".jpeg", ".tiff", ".tif"]
+        if exifread is not None:
+            self.supported_formats.extend(RAW_FORMATS)
+
+    def extract_exif_data(self, image_path, errors=None):
+        """Extract EXIF data from a single image file
 
-    def extract_exif_data(self, image_path):
-        """Extract EXIF data from a single image file"""
+        Failures are printed, or appended to errors as (path, repr(exception)) when a list is
+        given so batch callers can report them once instead of writing to stdout per photo.
+        """
         try:
-            with PIL.Image.open(image_path) as img:
-                exif_data = img.getexif()
+            if exifread is not None and str(image_path).lower().endswith(RAW_FORMATS):
+                return self._read_raw_exif(image_path)
+
+            with open(image_path, "rb") as f:
+                head = f.read(JPEG_HEADER_BYTES)
+
+            # Most camera JPEGs take the struct-based parser; anything unusual goes to Pillow
+            if head[:2] == b"\xff\xd8":
+                segment = _jpeg_exif_segment(head)
+                readable_exif = _parse_exif_segment(segment) if segment is not None else None
+                if readable_exif is not None:
+                    return readable_exif
+
+            exif_data = self._read_exif(image_path, head)
 
             if not exif_data:
                 return None
 
             # Convert EXIF data to readable format
             readable_exif = {}
+            tag_names = self._TAG_NAME
 
-            for tag_id, value in exif_data.items():
-                tag = TAGS.get(tag_id, tag_id)
+            for tag_id in self._WANTED_TAG_IDS & exif_data.keys():
+                tag = tag_names[tag_id]
 
-                # Handle GPS data separately
+                # Handle GPS data separately; the top-level tag only holds the IFD offset.
+                # Only the coordinate tags are looked up, by ID, rather than naming them all
                 if tag == "GPSInfo":
-                    gps_data = {}
-                    for gps_tag_id, gps_value in value.items():
-                        gps_tag = GPSTAGS.get(gps_tag_id, gps_tag_id)
-                        gps_data[gps_tag] = gps_value
-                    readable_exif[tag] = gps_data
+                    gps_ifd = exif_data.get_ifd(tag_id)
+                    readable_exif[tag] = {
+                        name: gps_ifd[gps_tag_id]
+                        for gps_tag_id, name in self._GPS_TAG_NAME
+                        if gps_tag_id in gps_ifd
+                    }
                 else:
-                    readable_exif[tag] = value
+                    readable_exif[tag] = exif_data[tag_id]
 
             return readable_exif
 
         except Exception as e:
-            print(f"Error processing {image_path}: {str(e)}")
+            if errors is None:
+                print(f"Error processing {image_path}: {str(e)}")
+            else:
+                errors.append((str(image_path), repr(e)))
             return None
 
+    def _read_exif(self, image_path, head):
+        """Read EXIF from the header prefix of JPEGs, falling back to opening the full file"""
+        if head[:2] == b"\xff\xd8":
+            segment = _jpeg_exif_segment(head)
+            if segment is not None:
+                try:
+                    exif_data = PIL.Image.Exif()
+                    exif_data.load(segment)
+                    if exif_data:
+                        return exif_data
+                except Exception:
+                    pass
+
+            # The whole file fit in the prefix, so there is nothing more to read
+            if len(head) < JPEG_HEADER_BYTES:
+                return None
+
+        with PIL.Image.open(image_path) as img:
+            return img.getexif()
+
+    def _read_raw_exif(self, image_path):
+        """Read the wanted tags from a RAW file's header with exifread
+
+        details=False skips MakerNote decoding, and the EXIF IFD scan stops at LensModel.
+        """
+        with open(image_path, "rb") as f:
+            tags = exifread.process_file(f, details=False, stop_tag="LensModel")
+
+        readable_exif = {
+            name: _exifread_value(tags[key]) for key, name in EXIFREAD_TAGS if key in tags
+        }
+        gps_data = {
+            name: _exifread_value(tags[key]) for key, name in EXIFREAD_GPS_TAGS if key in tags
+        }
+        if gps_data:
+            readable_exif["GPSInfo"] = gps_data
+
+        return readable_exif or None
+
     def convert_gps_to_decimal(self, gps_info):
         """Convert GPS coordinates from EXIF format to decimal degrees"""
         if not gps_info or "GPSLatitude" not in gps_info or "GPSLongitude" not in gps_info:
             return None, None
 
-        def convert_to_degrees(value):
-            d, m, s = float(value[0]), float(value[1]), float(value[2])
-            return d + (m / 60.0) + (s / 3600.0)
-
-        lat = convert_to_degrees(gps_info["GPSLatitude"])
-        lon = convert_to_degrees(gps_info["GPSLongitude"])
+        lat = _dms_to_deg(gps_info["GPSLatitude"])
+        lon = _dms_to_deg(gps_info["GPSLongitude"])
 
         # Check for direction
         if gps_info.get("GPSLatitudeRef") == "S":
@@ -92,6 +602,7 @@ class PhotoMetadataAnalyzer:
         # Focal Length
         if "FocalLength" in exif_data:
             settings["focal_length"] = f"{exif_data['FocalLength']}mm"
+            settings["focal_length_mm"] = float(exif_data["FocalLength"])
 
         # Camera and Lens
         settings["camera"] = exif_data.get("Model", "Unknown")
@@ -107,76 +618,270 @@ class PhotoMetadataAnalyzer:
 
         return settings
 
-    def process_photo_directory(self, directory_path, recursive=True):
-        """Process all photos in a directory and extract metadata"""
-        photo_data = []
+    def extract_raw_record(self, img_path, file_size=None, errors=None):
+        """Extract the raw RAW_FIELDS tuple for a single photo, or None if it has no EXIF
 
-        directory = Path(directory_path)
+        Pass file_size when the caller has already stat()ed the file to skip a second stat.
+        errors is passed through to extract_exif_data.
+        """
+        exif_data = self.extract_exif_data(img_path, errors)
 
-        if recursive:
-            image_files = []
-            for ext in self.supported_formats:
-                image_files.extend(directory.rglob(f"*{ext}"))
-                image_files.extend(directory.rglob(f"*{ext.upper()}"))
-        else:
-            image_files = []
-            for ext in self.supported_formats:
-                image_files.extend(directory.glob(f"*{ext}"))
-                image_files.extend(directory.glob(f"*{ext.upper()}"))
-
-        for img_path in image_files:
-            exif_data = self.extract_exif_data(img_path)
-
-            if exif_data:
-                # Parse camera settings
-                settings = self.parse_camera_settings(exif_data)
+        if not exif_data:
+            return None
 
-                # GPS coordinates
-                gps_info = exif_data.get("GPSInfo", {})
-                lat, lon = self.convert_gps_to_decimal(gps_info)
+        gps_info = exif_data.get("GPSInfo") or {}
+        has_gps = "GPSLatitude" in gps_info and "GPSLongitude" in gps_info
+
+        return (
+            img_path.name,
+            str(img_path),
+            file_size if file_size is not None else img_path.stat().st_size,
+            _to_float(exif_data.get("FNumber")),
+            _to_float(exif_data.get("ApertureValue")),
+            _to_float(exif_data.get("ExposureTime")),
+            exif_data.get("ISOSpeedRatings", exif_data.get("ISO")),
+            _to_float(exif_data.get("FocalLength")),
+            _intern(exif_data.get("Model")),
+            _intern(exif_data.get("Make")),
+            _intern(exif_data.get("LensModel")),
+            exif_data.get("DateTime"),
+            _dms_tuple(gps_info["GPSLatitude"]) if has_gps else None,
+            gps_info.get("GPSLatitudeRef"),
+            _dms_tuple(gps_info["GPSLongitude"]) if has_gps else None,
+            gps_info.get("GPSLongitudeRef"),
+        )
+
+    def _extract_with_error(self, img_path, file_size=None):
+        """(raw record, (path, error) or None) for one photo, for the batch workers"""
+        errors = []
+        record = self.extract_raw_record(img_path, file_size, errors)
+        return record, errors[0] if errors else None
+
+    def records_to_dataframe(self, records):
+        """Build the metadata DataFrame from raw records, deriving the columns vectorized"""
+        if not records:
+            return pd.DataFrame()
+
+        raw = pd.DataFrame.from_records(records, columns=RAW_FIELDS)
+        df = pd.DataFrame(
+            {
+                "filename": raw["filename"],
+                "filepath": raw["filepath"],
+                "file_size_mb": raw["file_size"] / (1024 * 1024),
+            }
+        )
+
+        # GPS coordinates, only where both latitude and longitude are present
+        df["latitude"] = np.nan
+        df["longitude"] = np.nan
+        has_gps = (raw["GPSLatitude"].notna() & raw["GPSLongitude"].notna()).to_numpy()
+        if has_gps.any():
+            gps = raw[has_gps]
+            lat = np.array(gps["GPSLatitude"].tolist(), dtype=np.float64)
+            lon = np.array(gps["GPSLongitude"].tolist(), dtype=np.float64)
+            dms = np.stack([lat, lon], axis=1)
+            negative = np.column_stack(
+                [
+                    (gps["GPSLatitudeRef"] == "S").to_numpy(),
+                    (gps["GPSLongitudeRef"] == "W").to_numpy(),
+                ]
+            )
+            signs = np.where(negative, -1.0, 1.0)
+            coords = (dms[:, :, 0] + dms[:, :, 1] / 60.0 + dms[:, :, 2] / 3600.0) * signs
+            df.loc[has_gps, "latitude"] = coords[:, 0]
+            df.loc[has_gps, "longitude"] = coords[:, 1]
+
+        # Aperture, falling back to the APEX value
+        fnumber = raw["FNumber"].astype(np.float64)
+        aperture = fnumber.fillna(2 ** (raw["ApertureValue"].astype(np.float64) / 2))
+        if aperture.notna().any():
+            df["aperture"] = (
+                pd.Series(np.char.mod("f/%.1f", aperture.to_numpy()), index=raw.index)
+                .where(aperture.notna())
+                .astype("category")
+            )
+
+        # Shutter speed
+        exposure = raw["ExposureTime"].astype(np.float64)
+        if exposure.notna().any():
+            fast = exposure < 1
+            reciprocal = (1 / exposure.where(fast & (exposure > 0))).dropna()
+            shutter = pd.Series(None, index=raw.index, dtype=object)
+            shutter[reciprocal.index] = "1/" + reciprocal.astype(np.int64).astype(str)
+            slow = exposure >= 1
+            shutter[slow] = exposure[slow].astype(str) + "s"
+            df["shutter_speed"] = shutter.astype("category")
 
-                # Combine all data
-                photo_record = {
-                    "filename": img_path.name,
-                    "filepath": str(img_path),
-                    "file_size_mb": img_path.stat().st_size / (1024 * 1024),
-                    "latitude": lat,
-                    "longitude": lon,
-                    **settings,
-                }
+        # ISO
+        if raw["ISO"].notna().any():
+            df["iso"] = raw["ISO"]
+
+        # Focal length, plus a numeric copy so consumers don't have to parse the label back
+        focal_length = raw["FocalLength"].astype(np.float64)
+        if focal_length.notna().any():
+            df["focal_length"] = (
+                (focal_length.astype(str) + "mm").where(focal_length.notna()).astype("category")
+            )
+            df["focal_length_mm"] = focal_length
+
+        # Camera and lens; like the setting strings above, a library repeats a handful of
+        # values, so they are stored as categoricals
+        df["camera"] = raw["Model"].fillna("Unknown").astype("category")
+        df["make"] = raw["Make"].fillna("Unknown").astype("category")
+        df["lens"] = raw["LensModel"].fillna("Unknown").astype("category")
+
+        # Date/time
+        if raw["DateTime"].notna().any():
+            df["datetime"] = pd.to_datetime(
+                raw["DateTime"], format="%Y:%m:%d %H:%M:%S", errors="coerce"
+            )
+
+        return df
+
+    def process_photo_directory(
+        self,
+        directory_path,
+        recursive=True,
+        workers=1,
+        file_list=None,
+        use_cache=False,
+        executor="process",
+        progress=None,
+    ):
+        """Process all photos in a directory and extract metadata
+
+        With workers > 1 (or None for one per CPU) the files are spread across a
+        process pool, since EXIF extraction is a mix of file I/O and CPU-bound tag
+        decoding. executor="thread" uses a thread pool instead, which avoids process
+        start-up and pickling when the files are small or the reads dominate (e.g. a
+        network share). Callers that have already enumerated the directory can pass
+        file_list, of paths or of (path, size) pairs as yielded by iter_image_files, to skip
+        the walk; the walk itself skips files under MIN_PHOTO_BYTES.
+        With use_cache, files whose mtime and size match their entry in CACHE_PATH are
+        not reopened. Unreadable photos are skipped and reported in a single log warning;
+        their (path, error) pairs are kept in last_errors.
+        progress, if given, is called as progress(done, total) once the cached files are
+        counted and again after each extracted file, from the calling thread.
+        """
+        if executor not in ("process", "thread"):
+            raise ValueError(f"executor must be 'process' or 'thread', not {executor!r}")
 
-                photo_data.append(photo_record)
+        directory = Path(directory_path)
 
-        return pd.DataFrame(photo_data)
+        if file_list is not None:
+            listed = [entry if isinstance(entry, tuple) else (entry, None) for entry in file_list]
+        else:
+            listed = iter_image_files(
+                directory, recursive, tuple(self.supported_formats), MIN_PHOTO_BYTES
+            )
+        image_files = []
+        sizes = []
+        for path, size in listed:
+            image_files.append(Path(path))
+            sizes.append(size)
+
+        records = [None] * len(image_files)
+        stamps = [None] * len(image_files)
+        pending = list(range(len(image_files)))
+
+        # Look up and write the cache here rather than in the workers: shelve has no
+        # concurrent-writer support
+        cache = _open_cache(CACHE_PATH) if use_cache else None
+        if cache is not None:
+            pending = []
+            for index, img_path in enumerate(image_files):
+                stamps[index] = stamp = _file_stamp(img_path)
+                entry = cache.get(f"{EXTRACTOR_VERSION}:{stamp[0]}") if stamp else None
+                # Cached values exclude filename and filepath, which depend on the caller
+                if entry is None or entry[0] != stamp[1]:
+                    pending.append(index)
+                elif entry[1] is not None:
+                    records[index] = (img_path.name, str(img_path)) + entry[1]
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        pending_files = [image_files[index] for index in pending]
+        # Sizes from the walk or the cache stamps, so the workers don't stat those files again
+        pending_sizes = [
+            stamps[index][1][1] if stamps[index] else sizes[index] for index in pending
+        ]
+
+        # Results stay in input order; progress hears about each one as it arrives
+        def collect(results):
+            if progress is None:
+                return list(results)
+            done = len(image_files) - len(pending_files)
+            progress(done, len(image_files))
+            return list(_with_progress(results, progress, done, len(image_files)))
+
+        if workers > 1 and len(pending_files) > 1 and executor == "thread":
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                extracted = collect(
+                    pool.map(self._extract_with_error, pending_files, pending_sizes)
+                )
+        elif workers > 1 and len(pending_files) > 1:
+            chunksize = max(1, min(32, len(pending_files) // (4 * workers)))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                extracted = collect(
+                    pool.map(_extract_one, pending_files, pending_sizes, chunksize=chunksize)
+                )
+        else:
+            extracted = collect(
+                self._extract_with_error(img_path, file_size)
+                for img_path, file_size in zip(pending_files, pending_sizes)
+            )
+
+        errors = []
+        for index, (record, error) in zip(pending, extracted):
+            records[index] = record
+            if error is not None:
+                errors.append(error)
+            if cache is not None and stamps[index] is not None:
+                path_key, stat_key = stamps[index]
+                values = record[2:] if record is not None else None
+                cache[f"{EXTRACTOR_VERSION}:{path_key}"] = (stat_key, values)
+
+        if cache is not None:
+            cache.close()
+
+        # One log call for the whole batch rather than a print per photo from each worker
+        self.last_errors = errors
+        if errors:
+            logger.warning(
+                "Could not read %d of %d photos:\n%s",
+                len(errors),
+                len(image_files),
+                "\n".join(f"  {path}: {error}" for path, error in errors),
+            )
+
+        return self.records_to_dataframe([record for record in records if record is not None])
 
     def generate_insights(self, df):
         """Generate analytical insights from the photo metadata"""
-        insights = {}
-
-        # Camera usage statistics
-        insights["camera_usage"] = df["camera"].value_counts().to_dict()
-        insights["lens_usage"] = df["lens"].value_counts().to_dict()
+        # Location insights (if GPS data available)
+        gps_count = int((df["latitude"].notna() & df["longitude"].notna()).sum())
+        insights = Insights(
+            camera_usage=_value_counts_dict(df["camera"]),
+            lens_usage=_value_counts_dict(df["lens"]),
+            gps_enabled_photos=gps_count,
+            total_photos=len(df),
+            gps_percentage=(gps_count / len(df)) * 100 if len(df) > 0 else 0,
+        )
 
         # Settings analysis
         if "iso" in df.columns:
-            insights["avg_iso"] = df["iso"].mean()
-            insights["iso_distribution"] = df["iso"].value_counts().to_dict()
+            insights.avg_iso = df["iso"].mean()
+            insights.iso_distribution = df["iso"].value_counts().to_dict()
 
         # Time-based patterns
         if "datetime" in df.columns and df["datetime"].notna().any():
-            df["hour"] = df["datetime"].dt.hour
-            df["month"] = df["datetime"].dt.month
-            df["year"] = df["datetime"].dt.year
+            # Kept as local arrays so the caller's frame (and any export of it) is left untouched
+            hours, months, years = _calendar_fields(df["datetime"].to_numpy())
 
-            insights["shooting_hours"] = df["hour"].value_counts().sort_index().to_dict()
-            insights["shooting_months"] = df["month"].value_counts().sort_index().to_dict()
-            insights["photos_per_year"] = df["year"].value_counts().sort_index().to_dict()
-
-        # Location insights (if GPS data available)
-        gps_photos = df.dropna(subset=["latitude", "longitude"])
-        insights["gps_enabled_photos"] = len(gps_photos)
-        insights["total_photos"] = len(df)
-        insights["gps_percentage"] = (len(gps_photos) / len(df)) * 100 if len(df) > 0 else 0
+            insights.shooting_hours = pd.Series(hours).value_counts().sort_index().to_dict()
+            insights.shooting_months = pd.Series(months).value_counts().sort_index().to_dict()
+            insights.photos_per_year = pd.Series(years).value_counts().sort_index().to_dict()
 
         return insights
 
@@ -199,11 +904,15 @@ def main():
         # Generate insights
         insights = analyzer.generate_insights(df)
         print("\nInsights:")
-        print(json.dumps(insights, indent=2, default=str))
+        print(json.dumps(insights.to_dict(), indent=2, default=str))
 
-        # Save to CSV for further analysis
-        df.to_csv("photo_metadata.csv", index=False)
-        print("\nData saved to photo_metadata.csv")
+        # Save for further analysis: columnar Parquet when an engine is installed, else CSV
+        try:
+            df.to_parquet("photo_metadata.parquet", index=False)
+            print("\nData saved to photo_metadata.parquet")
+        except ImportError:
+            df.to_csv("photo_metadata.csv", index=False)
+            print("\nData saved to photo_metadata.csv")
     else:
         print(f"Directory {photo_directory} not found. Update the path to test.")
 
@@ -1,17 +1,38 @@
 """Handle RAW files separately"""
 
-import rawpy
 import exifread
 
+# Tags used by the analysis, as exifread "IFD Tag" keys
+RAW_TAGS = (
+    "EXIF FNumber",
+    "EXIF ExposureTime",
+    "EXIF ISOSpeedRatings",
+    "EXIF FocalLength",
+    "Image Model",
+    "Image Make",
+    "EXIF LensModel",
+    "Image DateTime",
+    "GPS GPSLatitude",
+    "GPS GPSLongitude",
+    "GPS GPSLatitudeRef",
+    "GPS GPSLongitudeRef",
+)
+
 
 def process_raw_file(filepath):
-    try:
-        with rawpy.imread(filepath) as raw:
-            # Extract EXIF from RAW
-            exif_data = raw.metadata
-            return exif_data
-    except:
-        # Fallback to exifread
-        with open(filepath, "rb") as f:
-            tags = exifread.process_file(f)
-            return {tag: str(tags[tag]) for tag in tags}
+    """Read RAW metadata from the file header without decoding the sensor data
+
+    Returns exifread IfdTag objects (printable, with the parsed data in .values) for RAW_TAGS.
+    """
+    # details=False skips MakerNote decoding; the EXIF IFD scan stops once LensModel is read
+    with open(filepath, "rb") as f:
+        tags = exifread.process_file(f, details=False, stop_tag="LensModel")
+    return {tag: tags[tag] for tag in RAW_TAGS if tag in tags}
+
+
+def read_raw_pixels(filepath):
+    """Decode a RAW file to an RGB array (slow; only for callers that need pixel data)"""
+    import rawpy
+
+    with rawpy.imread(filepath) as raw:
+        return raw.postprocess()
@@ -2,10 +2,14 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import pydeck as pdk
 from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime
 import os
+import io
+import atexit
+import stat
 import threading
 import time
 import logging
@@ -13,10 +17,44 @@ import tempfile
 import shutil
 import json
 from pathlib import Path
+from collections import Counter, deque
+from itertools import islice
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
-from photo_analyzer.photo_metadata_analyzer import PhotoMetadataAnalyzer
+# Optional fast JSON encoder; the stdlib json module is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Arrow support: the IPC and Parquet readers used to preview staged binary files
+# without loading them whole. Binary staging falls back to CSV when it is missing
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Optional Rust-backed watcher (inotify/FSEvents/ReadDirectoryChangesW); watchdog's Observer
+# is used when it is missing
+try:
+    from watchfiles import watch, Change
+except ImportError:
+    watch = None
+
+# Newer Streamlit builds accept a callable as download_button data and only run it when the
+# button is clicked; older ones need the payload built on every rerun
+try:
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    DEFERRED_DOWNLOADS = hasattr(MediaFileManager, 'add_deferred')
+except ImportError:
+    DEFERRED_DOWNLOADS = False
+
+from photo_analyzer.photo_metadata_analyzer import PhotoMetadataAnalyzer, write_csv
 
 # Page configuration
 st.set_page_config(
@@ -37,74 +75,202 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Most file operations the monitor keeps; older entries are dropped, the counts are not
+OPERATIONS_LOG_MAXLEN = 100_000
+
+# Write buffer for staged CSV/JSON files, so large payloads go out in few write() calls
+STAGING_WRITE_BUFFER_BYTES = 1 << 20
+
+# Float columns stored as float32 in the session frame; ISO lands here when it has gaps.
+# GPS coordinates stay float64: float32 rounds them by up to a metre, and they are exported
+FLOAT32_COLUMNS = ('iso', 'file_size_mb', 'focal_length_mm')
+
+# Low-cardinality text columns stored as categoricals in the session frame
+CATEGORY_COLUMNS = ('camera', 'lens', 'aperture')
+
+# Rows per page of the raw data table, so large frames aren't shipped to the browser at once
+RAW_DATA_PAGE_ROWS = 1000
+
+# Download MIME type for each staged operation type
+STAGED_MIME_TYPES = {
+    'create_csv': "text/csv",
+    'create_feather': "application/vnd.apache.arrow.file",
+    'create_parquet': "application/vnd.apache.parquet",
+    'create_json': "application/json"
+}
+
 class FileOperationHandler(FileSystemEventHandler):
     """Watchdog handler to monitor and log file operations"""
     
-    def __init__(self):
-        self.operations_log = []
+    def __init__(self, max_log_entries=OPERATIONS_LOG_MAXLEN):
+        self.operations_log = deque(maxlen=max_log_entries)
+        # Running per-type totals, so summaries don't rescan the whole log
+        self.operation_counts = Counter()
         logger.info("FileOperationHandler initialized")
     
+    def _record(self, event_type, path):
+        """Append one file operation to the log; directories are ignored"""
+        # A single stat() gives both the size and the directory check, with no
+        # exists()/getsize() race when the file vanishes in between
+        size = 0
+        if event_type != 'deleted':
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                pass
+            else:
+                if stat.S_ISDIR(stat_result.st_mode):
+                    return
+                size = stat_result.st_size
+        
+        operation = {
+            'timestamp': datetime.now().isoformat(),
+            'event_type': event_type,
+            'path': path,
+            'size': size
+        }
+        self.operations_log.append(operation)
+        self.operation_counts[event_type] += 1
+        logger.info(f"File {event_type}: {path}")
+    
     def on_modified(self, event):
         if not event.is_directory:
-            operation = {
-                'timestamp': datetime.now().isoformat(),
-                'event_type': 'modified',
-                'path': event.src_path,
-                'size': os.path.getsize(event.src_path) if os.path.exists(event.src_path) else 0
-            }
-            self.operations_log.append(operation)
-            logger.info(f"File modified: {event.src_path}")
+            self._record('modified', event.src_path)
     
     def on_created(self, event):
         if not event.is_directory:
-            operation = {
-                'timestamp': datetime.now().isoformat(),
-                'event_type': 'created',
-                'path': event.src_path,
-                'size': os.path.getsize(event.src_path) if os.path.exists(event.src_path) else 0
-            }
-            self.operations_log.append(operation)
-            logger.info(f"File created: {event.src_path}")
+            self._record('created', event.src_path)
     
     def on_deleted(self, event):
         if not event.is_directory:
-            operation = {
-                'timestamp': datetime.now().isoformat(),
-                'event_type': 'deleted',
-                'path': event.src_path,
-                'size': 0
-            }
-            self.operations_log.append(operation)
-            logger.info(f"File deleted: {event.src_path}")
+            self._record('deleted', event.src_path)
     
     def get_operations_summary(self):
         """Get summary of recent file operations"""
         return {
-            'total_operations': len(self.operations_log),
-            'recent_operations': self.operations_log[-10:] if self.operations_log else [],
+            'total_operations': sum(self.operation_counts.values()),
+            'recent_operations': list(islice(reversed(self.operations_log), 10))[::-1],
             'operations_by_type': {
-                'created': len([op for op in self.operations_log if op['event_type'] == 'created']),
-                'modified': len([op for op in self.operations_log if op['event_type'] == 'modified']),
-                'deleted': len([op for op in self.operations_log if op['event_type'] == 'deleted'])
+                event_type: self.operation_counts[event_type]
+                for event_type in ('created', 'modified', 'deleted')
             }
         }
 
+class WatchfilesObserver(threading.Thread):
+    """Observer-compatible monitor thread that feeds watchfiles changes to a FileOperationHandler"""
+    
+    def __init__(self, handler, directory):
+        super().__init__(daemon=True)
+        self.handler = handler
+        self.directory = directory
+        self.stop_event = threading.Event()
+    
+    def run(self):
+        event_types = {Change.added: 'created', Change.modified: 'modified', Change.deleted: 'deleted'}
+        for changes in watch(self.directory, recursive=True, stop_event=self.stop_event):
+            for change, path in changes:
+                self.handler._record(event_types[change], path)
+    
+    def stop(self):
+        self.stop_event.set()
+
+def _csv_payload(df):
+    """The metadata table as CSV bytes for a download button"""
+    sink = io.BytesIO()
+    write_csv(df, sink)
+    return sink.getvalue()
+
+def _json_payload(df):
+    """The metadata table as a JSON array of records for a download button"""
+    return df.to_json(orient='records', date_format='iso').encode('utf-8')
+
+# Without deferred downloads the payloads are built on every rerun, so they are cached on the
+# frame's contents. The cache is shared across sessions, so max_entries bounds how many full
+# payloads stay in memory
+_csv_bytes = st.cache_data(show_spinner=False, max_entries=4)(_csv_payload)
+_json_bytes = st.cache_data(show_spinner=False, max_entries=4)(_json_payload)
+
+# Without deferred downloads each staged file's bytes are needed on every rerun; they are
+# cached on the path and mtime so a rewritten file is read again
+@st.cache_data(show_spinner=False, max_entries=16)
+def _staged_file_bytes(path, mtime_ns):
+    """Contents of a staged file (mtime_ns only keys the cache)"""
+    return Path(path).read_bytes()
+
+def _staged_file_data(path):
+    """download_button data for a staged file, read from disk on click where Streamlit allows it"""
+    if DEFERRED_DOWNLOADS:
+        return partial(Path(path).read_bytes)
+    return _staged_file_bytes(path, os.stat(path).st_mtime_ns)
+
+def _staged_table_csv(path):
+    """CSV bytes for a staged Feather or Parquet file, written straight from its Arrow table"""
+    if path.endswith('.parquet'):
+        table = pq.read_table(path)
+    else:
+        with pa_ipc.open_file(path) as reader:
+            table = reader.read_all()
+    sink = io.BytesIO()
+    write_csv(table, sink)
+    return sink.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _staged_table_csv_bytes(path, mtime_ns):
+    """_staged_table_csv cached on the staged file's path and mtime"""
+    return _staged_table_csv(path)
+
+def _staged_csv_data(path):
+    """download_button data converting a staged binary file to CSV, on click where Streamlit allows it"""
+    if DEFERRED_DOWNLOADS:
+        return partial(_staged_table_csv, path)
+    return _staged_table_csv_bytes(path, os.stat(path).st_mtime_ns)
+
+def _preview_value(value, max_chars):
+    """Short stand-in for a JSON value: containers are summarised, long scalars truncated"""
+    # Summarising containers avoids building the full repr of large nested payloads
+    if isinstance(value, (list, dict)):
+        return f"<{type(value).__name__} len={len(value)}>"
+    text = str(value)
+    return text[:max_chars] + '...' if len(text) > max_chars else value
+
 class StagingManager:
     """Manages staging area for file operations with preview capabilities"""
     
     def __init__(self):
         self.staging_dir = tempfile.mkdtemp(prefix="photo_analytics_staging_")
         self.staged_operations = []
+        self._operations_by_id = {}
+        # Summary totals, kept up to date as operations are staged and committed
+        self._pending_count = 0
+        self._committed_count = 0
+        self._total_size_mb = 0.0
         logger.info(f"StagingManager initialized with staging directory: {self.staging_dir}")
     
+    def _staging_path(self, staged_filename):
+        """Path for a new staged file, recreating the staging directory if it was cleaned up"""
+        # The temp directory can be removed underneath a long-lived session (e.g. by tmp cleaners)
+        os.makedirs(self.staging_dir, exist_ok=True)
+        return os.path.join(self.staging_dir, staged_filename)
+    
+    def _add_operation(self, operation):
+        """Record a staged operation and index it by ID"""
+        # IDs have one-second resolution, so disambiguate operations staged within the same second
+        if operation['operation_id'] in self._operations_by_id:
+            operation['operation_id'] += f"_{len(self.staged_operations)}"
+        self.staged_operations.append(operation)
+        self._operations_by_id[operation['operation_id']] = operation
+        self._pending_count += 1
+        self._total_size_mb += operation.get('size_mb', 0)
+    
     def stage_csv_creation(self, df, filename_base):
         """Stage a CSV file creation operation"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         staged_filename = f"{filename_base}_{timestamp}.csv"
-        staged_path = os.path.join(self.staging_dir, staged_filename)
+        staged_path = self._staging_path(staged_filename)
         
-        # Create staged file
-        df.to_csv(staged_path, index=False)
+        # Create staged file through a 1 MiB buffer rather than the default 8 KiB one
+        with open(staged_path, 'wb', buffering=STAGING_WRITE_BUFFER_BYTES) as f:
+            write_csv(df, f)
         
         operation = {
             'operation_id': f"csv_{timestamp}",
@@ -118,19 +284,83 @@ class StagingManager:
             'status': 'staged'
         }
         
-        self.staged_operations.append(operation)
+        self._add_operation(operation)
         logger.info(f"CSV creation staged: {staged_filename} ({operation['size_mb']:.2f} MB)")
         return operation
     
-    def stage_json_creation(self, data, filename_base):
-        """Stage a JSON file creation operation"""
+    def stage_feather_creation(self, df, filename_base):
+        """Stage a zstd-compressed Feather file, falling back to CSV when pyarrow is missing"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        staged_filename = f"{filename_base}_{timestamp}.feather"
+        staged_path = self._staging_path(staged_filename)
+        
+        # Feather's columnar writer skips CSV's per-row string conversion
+        try:
+            df.to_feather(staged_path, compression='zstd')
+        except ImportError:
+            return self.stage_csv_creation(df, filename_base)
+        
+        operation = {
+            'operation_id': f"feather_{timestamp}",
+            'type': 'create_feather',
+            'staged_path': staged_path,
+            'filename': staged_filename,
+            'rows': len(df),
+            'columns': list(df.columns),
+            'size_mb': os.path.getsize(staged_path) / (1024 * 1024),
+            'timestamp': datetime.now().isoformat(),
+            'status': 'staged'
+        }
+        
+        self._add_operation(operation)
+        logger.info(f"Feather creation staged: {staged_filename} ({operation['size_mb']:.2f} MB)")
+        return operation
+    
+    def stage_parquet_creation(self, df, filename_base):
+        """Stage a zstd-compressed Parquet file, falling back to CSV when pyarrow is missing"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        staged_filename = f"{filename_base}_{timestamp}.parquet"
+        staged_path = self._staging_path(staged_filename)
+        
+        try:
+            df.to_parquet(staged_path, engine='pyarrow', compression='zstd', index=False)
+        except ImportError:
+            return self.stage_csv_creation(df, filename_base)
+        
+        operation = {
+            'operation_id': f"parquet_{timestamp}",
+            'type': 'create_parquet',
+            'staged_path': staged_path,
+            'filename': staged_filename,
+            'rows': len(df),
+            'columns': list(df.columns),
+            'size_mb': os.path.getsize(staged_path) / (1024 * 1024),
+            'timestamp': datetime.now().isoformat(),
+            'status': 'staged'
+        }
+        
+        self._add_operation(operation)
+        logger.info(f"Parquet creation staged: {staged_filename} ({operation['size_mb']:.2f} MB)")
+        return operation
+    
+    def stage_json_creation(self, data, filename_base, compact=True):
+        """Stage a JSON file creation operation; pass compact=False for indented output"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         staged_filename = f"{filename_base}_{timestamp}.json"
-        staged_path = os.path.join(self.staging_dir, staged_filename)
+        staged_path = self._staging_path(staged_filename)
         
         # Create staged file
-        with open(staged_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        if orjson is not None:
+            json_options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if not compact:
+                json_options |= orjson.OPT_INDENT_2
+            Path(staged_path).write_bytes(orjson.dumps(data, option=json_options, default=str))
+        else:
+            with open(staged_path, 'w', buffering=STAGING_WRITE_BUFFER_BYTES, encoding='utf-8') as f:
+                if compact:
+                    json.dump(data, f, separators=(',', ':'), default=str)
+                else:
+                    json.dump(data, f, indent=2, default=str)
         
         operation = {
             'operation_id': f"json_{timestamp}",
@@ -142,13 +372,13 @@ class StagingManager:
             'status': 'staged'
         }
         
-        self.staged_operations.append(operation)
+        self._add_operation(operation)
         logger.info(f"JSON creation staged: {staged_filename} ({operation['size_mb']:.2f} MB)")
         return operation
     
     def preview_operation(self, operation_id):
         """Get preview information for a staged operation"""
-        operation = next((op for op in self.staged_operations if op['operation_id'] == operation_id), None)
+        operation = self._operations_by_id.get(operation_id)
         if not operation:
             return None
         
@@ -159,40 +389,76 @@ class StagingManager:
         }
         
         if operation['type'] == 'create_csv':
-            # Preview first few rows of CSV
+            # Preview first few rows of CSV; nrows stops parsing after them
             try:
-                df_preview = pd.read_csv(operation['staged_path']).head(5)
+                df_preview = pd.read_csv(operation['staged_path'], nrows=5)
                 preview['preview_content'] = df_preview.to_dict('records')
             except Exception as e:
                 preview['preview_content'] = f"Error reading CSV: {str(e)}"
         
+        elif operation['type'] == 'create_feather':
+            # Preview first few rows of the Feather file, decoding only its first record batch
+            try:
+                with pa_ipc.open_file(operation['staged_path']) as reader:
+                    df_preview = reader.get_batch(0).slice(0, 5).to_pandas()
+                preview['preview_content'] = df_preview.to_dict('records')
+            except Exception as e:
+                preview['preview_content'] = f"Error reading Feather: {str(e)}"
+        
+        elif operation['type'] == 'create_parquet':
+            # Preview first few rows of the Parquet file, decoding only the first batch
+            try:
+                with pq.ParquetFile(operation['staged_path']) as parquet_file:
+                    batch = next(parquet_file.iter_batches(batch_size=5), None)
+                if batch is not None:
+                    preview['preview_content'] = batch.to_pandas().to_dict('records')
+            except Exception as e:
+                preview['preview_content'] = f"Error reading Parquet: {str(e)}"
+        
         elif operation['type'] == 'create_json':
             # Preview JSON structure
             try:
                 with open(operation['staged_path'], 'r') as f:
                     data = json.load(f)
                     if isinstance(data, dict):
-                        preview['preview_content'] = {k: str(v)[:100] + '...' if len(str(v)) > 100 else v 
-                                                    for k, v in list(data.items())[:5]}
+                        preview['preview_content'] = {k: _preview_value(v, 100) for k, v in islice(data.items(), 5)}
                     else:
-                        preview['preview_content'] = str(data)[:500] + '...' if len(str(data)) > 500 else data
+                        preview['preview_content'] = _preview_value(data, 500)
             except Exception as e:
                 preview['preview_content'] = f"Error reading JSON: {str(e)}"
         
         return preview
     
+    def preview_operations(self, operation_ids, max_workers=8):
+        """Previews for several staged operations, read on a thread pool
+
+        File reads and the CSV/Arrow/JSON parsers release the GIL, so the reads overlap.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.preview_operation, operation_ids))
+    
     def commit_operation(self, operation_id, target_dir=None):
-        """Commit a staged operation to the target directory"""
-        operation = next((op for op in self.staged_operations if op['operation_id'] == operation_id), None)
+        """Commit a staged operation to the target directory
+
+        On the staging directory's filesystem the staged file is moved with a metadata-only
+        rename; elsewhere it is copied.
+        """
+        operation = self._operations_by_id.get(operation_id)
         if not operation:
             return False, "Operation not found"
         
         try:
             if target_dir:
                 target_path = os.path.join(target_dir, operation['filename'])
-                shutil.copy2(operation['staged_path'], target_path)
+                if os.stat(self.staging_dir).st_dev == os.stat(target_dir).st_dev:
+                    os.replace(operation['staged_path'], target_path)
+                else:
+                    shutil.copy2(operation['staged_path'], target_path)
                 operation['committed_path'] = target_path
             
+            if operation['status'] == 'staged':
+                self._pending_count -= 1
+                self._committed_count += 1
             operation['status'] = 'committed'
             operation['commit_timestamp'] = datetime.now().isoformat()
             
@@ -220,9 +486,9 @@ class StagingManager:
         return {
             'staging_dir': self.staging_dir,
             'total_operations': len(self.staged_operations),
-            'pending_operations': len([op for op in self.staged_operations if op['status'] == 'staged']),
-            'committed_operations': len([op for op in self.staged_operations if op['status'] == 'committed']),
-            'total_staged_size_mb': sum(op.get('size_mb', 0) for op in self.staged_operations)
+            'pending_operations': self._pending_count,
+            'committed_operations': self._committed_count,
+            'total_staged_size_mb': self._total_size_mb
         }
 st.markdown("""
 <style>
@@ -293,26 +559,39 @@ if 'file_handler' not in st.session_state:
     st.session_state.file_handler = FileOperationHandler()
 if 'staging_manager' not in st.session_state:
     st.session_state.staging_manager = StagingManager()
+    # Staged files must survive reruns, so they are only removed when the server exits
+    atexit.register(st.session_state.staging_manager.cleanup)
 if 'observer' not in st.session_state:
     st.session_state.observer = None
+if 'watched_directory' not in st.session_state:
+    st.session_state.watched_directory = None
 
 # Log application start
 logger.info("Streamlit Photo Analytics Dashboard started")
 
 def start_file_monitoring(directory):
     """Start monitoring file operations in the specified directory"""
+    # Re-selecting the watched directory keeps the running observer instead of joining it
+    observer = st.session_state.observer
+    if observer and observer.is_alive() and st.session_state.watched_directory == directory:
+        return True
+    
     try:
         if st.session_state.observer:
             st.session_state.observer.stop()
             st.session_state.observer.join()
         
-        st.session_state.observer = Observer()
-        st.session_state.observer.schedule(
-            st.session_state.file_handler, 
-            directory, 
-            recursive=True
-        )
+        if watch is not None:
+            st.session_state.observer = WatchfilesObserver(st.session_state.file_handler, directory)
+        else:
+            st.session_state.observer = Observer()
+            st.session_state.observer.schedule(
+                st.session_state.file_handler, 
+                directory, 
+                recursive=True
+            )
         st.session_state.observer.start()
+        st.session_state.watched_directory = directory
         logger.info(f"File monitoring started for directory: {directory}")
         return True
     except Exception as e:
@@ -326,6 +605,7 @@ def stop_file_monitoring():
             st.session_state.observer.stop()
             st.session_state.observer.join()
             st.session_state.observer = None
+            st.session_state.watched_directory = None
             logger.info("File monitoring stopped")
     except Exception as e:
         logger.error(f"Error stopping file monitoring: {str(e)}")
@@ -335,22 +615,37 @@ def browse_directory():
     # This function is now just a placeholder since we're using text input
     return None
 
-def process_directory_async(directory_path, recursive=True):
+def _status_progress(status, label):
+    """process_photo_directory progress callback relabelling an st.status box every ~1% of files"""
+    last_shown = -1
+    
+    def progress(done, total):
+        nonlocal last_shown
+        if done == total or done - last_shown >= max(1, total // 100):
+            last_shown = done
+            status.update(label=f"{label}: {done}/{total}")
+    
+    return progress
+
+def process_directory_async(directory_path, recursive=True, workers=None):
     """Process directory in a separate thread to avoid blocking UI"""
     try:
         logger.info(f"Starting photo processing for directory: {directory_path} (recursive: {recursive})")
         st.session_state.processing_status = "Processing photos..."
         
-        df = st.session_state.analyzer.process_photo_directory(directory_path, recursive=recursive)
+        # workers=None spreads EXIF extraction over a process pool, one worker per CPU
+        df = _coerce_exif_dtypes(
+            st.session_state.analyzer.process_photo_directory(directory_path, recursive=recursive, workers=workers)
+        )
         st.session_state.df = df
         
         logger.info(f"Photo processing completed. Found {len(df)} photos with metadata")
         st.session_state.processing_status = f"✅ Successfully processed {len(df)} photos!"
         
-        # Auto-stage CSV creation
+        # Auto-stage the metadata table; CSV is kept for explicit user exports
         if len(df) > 0:
-            staging_op = st.session_state.staging_manager.stage_csv_creation(df, "photo_metadata")
-            logger.info(f"CSV automatically staged: {staging_op['operation_id']}")
+            staging_op = st.session_state.staging_manager.stage_feather_creation(df, "photo_metadata")
+            logger.info(f"Metadata automatically staged: {staging_op['operation_id']}")
         
         return df
     except Exception as e:
@@ -359,44 +654,73 @@ def process_directory_async(directory_path, recursive=True):
         st.session_state.processing_status = f"❌ {error_msg}"
         return None
 
+def _coerce_exif_dtypes(df):
+    """EXIF columns in compact dtypes; run once when data is loaded
+
+    Adds focal_length_mm parsed from the "50mm" labels for frames that only have the labels,
+    so the charts never parse strings on a rerun, narrows the numeric columns, and makes the
+    equipment columns categorical so their value_counts are bincounts over integer codes.
+    """
+    if 'focal_length' in df.columns and 'focal_length_mm' not in df.columns:
+        labels = df['focal_length'].astype(str).str.removesuffix('mm')
+        df = df.assign(focal_length_mm=pd.to_numeric(labels, errors='coerce').astype(np.float32))
+    
+    dtypes = {col: np.float32 for col in FLOAT32_COLUMNS if col in df.columns and df[col].dtype == np.float64}
+    # ISO reaches six figures on some bodies, so int16 is only used when every value fits
+    if 'iso' in df.columns and pd.api.types.is_integer_dtype(df['iso'].dtype) and len(df) > 0:
+        dtypes['iso'] = np.int16 if df['iso'].max() <= np.iinfo(np.int16).max else np.int32
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            dtypes[col] = 'category'
+    return df.astype(dtypes) if dtypes else df
+
 def load_sample_data():
     """Create sample data for demonstration purposes"""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_photos = 150
     
     cameras = ['Canon EOS R5', 'Sony A7IV', 'Nikon Z6II', 'Fujifilm X-T4']
     lenses = ['24-70mm f/2.8', '70-200mm f/2.8', '50mm f/1.4', '16-35mm f/2.8', '85mm f/1.8']
     
-    sample_data = []
-    for i in range(n_photos):
-        # Generate realistic camera settings
-        aperture_values = [1.4, 1.8, 2.8, 4.0, 5.6, 8.0, 11.0]
-        iso_values = [100, 200, 400, 800, 1600, 3200, 6400]
-        
-        # Create datetime with some clustering around certain times
-        base_date = datetime(2023, 1, 1)
-        days_offset = np.random.randint(0, 365)
-        hour = np.random.choice([8, 9, 10, 16, 17, 18, 19, 20], p=[0.1, 0.15, 0.1, 0.15, 0.2, 0.15, 0.1, 0.05])
-        
-        sample_data.append({
-            'filename': f'IMG_{i+1000:04d}.jpg',
-            'camera': np.random.choice(cameras),
-            'lens': np.random.choice(lenses),
-            'aperture': f"f/{np.random.choice(aperture_values)}",
-            'iso': np.random.choice(iso_values),
-            'focal_length': f"{np.random.randint(24, 200)}mm",
-            'datetime': base_date.replace(day=1) + pd.Timedelta(days=days_offset, hours=hour),
-            'latitude': np.random.uniform(37.7, 37.8) if np.random.random() > 0.3 else None,  # SF area
-            'longitude': np.random.uniform(-122.5, -122.4) if np.random.random() > 0.3 else None,
-            'file_size_mb': np.random.uniform(15, 45)
-        })
-    
-    return pd.DataFrame(sample_data)
-
-def create_camera_usage_chart(df):
-    """Create camera usage visualization"""
-    camera_counts = df['camera'].value_counts()
+    # Realistic camera settings
+    aperture_values = [1.4, 1.8, 2.8, 4.0, 5.6, 8.0, 11.0]
+    iso_values = [100, 200, 400, 800, 1600, 3200, 6400]
     
+    # Datetimes through 2023, with shooting clustered around morning and evening hours
+    base_date = pd.Timestamp(2023, 1, 1)
+    days_offset = rng.integers(0, 365, n_photos)
+    hours = rng.choice([8, 9, 10, 16, 17, 18, 19, 20], n_photos, p=[0.1, 0.15, 0.1, 0.15, 0.2, 0.15, 0.1, 0.05])
+    
+    focal_length_mm = rng.integers(24, 200, n_photos)
+    
+    # Roughly 70% of photos carry each GPS coordinate (SF area)
+    latitude = np.where(rng.random(n_photos) > 0.3, rng.uniform(37.7, 37.8, n_photos), np.nan)
+    longitude = np.where(rng.random(n_photos) > 0.3, rng.uniform(-122.5, -122.4, n_photos), np.nan)
+    
+    # One vectorized draw per column rather than several per row
+    return _coerce_exif_dtypes(pd.DataFrame({
+        'filename': [f'IMG_{i + 1000:04d}.jpg' for i in range(n_photos)],
+        'camera': rng.choice(cameras, n_photos),
+        'lens': rng.choice(lenses, n_photos),
+        'aperture': rng.choice([f"f/{value}" for value in aperture_values], n_photos),
+        'iso': rng.choice(np.array(iso_values, dtype=np.int16), n_photos),
+        'focal_length': pd.Series(focal_length_mm).astype(str) + 'mm',
+        'focal_length_mm': focal_length_mm.astype(np.float32),
+        'datetime': base_date + pd.to_timedelta(days_offset, unit='D') + pd.to_timedelta(hours, unit='h'),
+        'latitude': latitude,
+        'longitude': longitude,
+        'file_size_mb': rng.uniform(15, 45, n_photos).astype(np.float32)
+    }))
+
+# The create_* chart builders are cached on the frame's contents, so widget-driven
+# reruns with unchanged data skip the pandas and plotly work. cache_resource hands back the
+# cached figure itself: cache_data would unpickle a copy on every rerun, which costs several
+# times more than Streamlit's own JSON serialization of the figure. Callers must not mutate it.
+# cache_resource is shared across sessions, so max_entries bounds how many frames' figures
+# (and map point payloads) stay alive
+@st.cache_resource(show_spinner=False, max_entries=4)
+def create_camera_usage_chart(camera_counts):
+    """Create camera usage visualization from df['camera'].value_counts()"""
     fig = px.pie(
         values=camera_counts.values,
         names=camera_counts.index,
@@ -406,10 +730,9 @@ def create_camera_usage_chart(df):
     fig.update_traces(textposition='inside', textinfo='percent+label')
     return fig
 
-def create_lens_usage_chart(df):
-    """Create lens usage visualization"""
-    lens_counts = df['lens'].value_counts()
-    
+@st.cache_resource(show_spinner=False, max_entries=4)
+def create_lens_usage_chart(lens_counts):
+    """Create lens usage visualization from df['lens'].value_counts()"""
     fig = px.bar(
         x=lens_counts.values,
         y=lens_counts.index,
@@ -421,6 +744,7 @@ def create_lens_usage_chart(df):
     fig.update_layout(yaxis={'categoryorder': 'total ascending'})
     return fig
 
+@st.cache_resource(show_spinner=False, max_entries=4)
 def create_settings_analysis(df):
     """Create camera settings analysis charts"""
     fig = make_subplots(
@@ -430,48 +754,72 @@ def create_settings_analysis(df):
                [{"secondary_y": False}, {"secondary_y": False}]]
     )
     
+    # Traces are collected with their cells and added in one add_traces call, from NumPy arrays
+    # rather than Series
+    traces, rows, cols = [], [], []
+    
     # ISO Distribution
     if 'iso' in df.columns:
         iso_counts = df['iso'].value_counts().sort_index()
-        fig.add_trace(
-            go.Bar(x=iso_counts.index, y=iso_counts.values, name='ISO', marker_color='lightblue'),
-            row=1, col=1
-        )
+        traces.append(go.Bar(x=iso_counts.index.to_numpy(), y=iso_counts.to_numpy(), name='ISO', marker_color='lightblue'))
+        rows.append(1)
+        cols.append(1)
     
     # Aperture Usage
     if 'aperture' in df.columns:
         aperture_counts = df['aperture'].value_counts()
-        fig.add_trace(
-            go.Bar(x=aperture_counts.index, y=aperture_counts.values, name='Aperture', marker_color='lightgreen'),
-            row=1, col=2
-        )
+        traces.append(go.Bar(x=aperture_counts.index.to_numpy(), y=aperture_counts.to_numpy(), name='Aperture', marker_color='lightgreen'))
+        rows.append(1)
+        cols.append(2)
     
     # Focal Length Distribution
     if 'focal_length' in df.columns:
-        focal_lengths = df['focal_length'].str.replace('mm', '').astype(float)
-        fig.add_trace(
-            go.Histogram(x=focal_lengths, name='Focal Length', marker_color='lightcoral', nbinsx=20),
-            row=2, col=1
-        )
+        # Loaded frames carry focal_length_mm (see _coerce_exif_dtypes); parse labels otherwise
+        if 'focal_length_mm' in df.columns:
+            focal_lengths = df['focal_length_mm']
+        else:
+            focal_lengths = pd.to_numeric(df['focal_length'].astype(str).str.removesuffix('mm'), errors='coerce')
+        traces.append(go.Histogram(x=focal_lengths.to_numpy(), name='Focal Length', marker_color='lightcoral', nbinsx=20))
+        rows.append(2)
+        cols.append(1)
     
     # File Size Distribution
     if 'file_size_mb' in df.columns:
-        fig.add_trace(
-            go.Histogram(x=df['file_size_mb'], name='File Size (MB)', marker_color='lightyellow', nbinsx=20),
-            row=2, col=2
-        )
+        traces.append(go.Histogram(x=df['file_size_mb'].to_numpy(), name='File Size (MB)', marker_color='lightyellow', nbinsx=20))
+        rows.append(2)
+        cols.append(2)
     
+    if traces:
+        fig.add_traces(traces, rows=rows, cols=cols)
     fig.update_layout(height=600, showlegend=False, title_text="Camera Settings Analysis")
     return fig
 
+@st.cache_data(show_spinner=False)
+def _temporal_counts(datetimes):
+    """Photo counts per hour (24), month (12) and weekday (7, Monday first)
+
+    Cached on the datetime column alone. Each field comes from one datetime64 cast and an
+    np.bincount rather than a .dt accessor plus value_counts.
+    """
+    values = datetimes.dropna().to_numpy(dtype='datetime64[ns]')
+    hours = values.astype('datetime64[h]').astype(np.int64) % 24
+    months = values.astype('datetime64[M]').astype(np.int64) % 12
+    # 1970-01-01, day 0 of the epoch, was a Thursday
+    weekdays = (values.astype('datetime64[D]').astype(np.int64) + 3) % 7
+    return (
+        np.bincount(hours, minlength=24),
+        np.bincount(months, minlength=12),
+        np.bincount(weekdays, minlength=7)
+    )
+
+@st.cache_resource(show_spinner=False, max_entries=4)
 def create_temporal_analysis(df):
     """Create time-based analysis charts"""
     if 'datetime' not in df.columns or df['datetime'].isna().all():
         return None
     
-    df['hour'] = df['datetime'].dt.hour
-    df['month'] = df['datetime'].dt.month
-    df['weekday'] = df['datetime'].dt.day_name()
+    # Computed as arrays rather than columns on the caller's frame, which would change its cache key
+    hour_counts, month_counts, weekday_counts = _temporal_counts(df['datetime'])
     
     fig = make_subplots(
         rows=2, cols=2,
@@ -480,67 +828,65 @@ def create_temporal_analysis(df):
                [{"secondary_y": False}, {"secondary_y": False}]]
     )
     
-    # Hour distribution
-    hour_counts = df['hour'].value_counts().sort_index()
-    fig.add_trace(
-        go.Scatter(x=hour_counts.index, y=hour_counts.values, mode='lines+markers', 
-                  name='Hourly', line=dict(color='blue')),
-        row=1, col=1
-    )
+    # Hour distribution, over the hours that have photos
+    hours = np.flatnonzero(hour_counts)
+    hourly = go.Scatter(x=hours, y=hour_counts[hours], mode='lines+markers', 
+                        name='Hourly', line=dict(color='blue'))
     
-    # Month distribution
-    month_counts = df['month'].value_counts().sort_index()
+    # Month distribution, over the months that have photos
+    months = np.flatnonzero(month_counts)
     month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
                    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    fig.add_trace(
-        go.Bar(x=[month_names[i-1] for i in month_counts.index], y=month_counts.values, 
-               name='Monthly', marker_color='green'),
-        row=1, col=2
-    )
+    monthly = go.Bar(x=[month_names[i] for i in months], y=month_counts[months], 
+                     name='Monthly', marker_color='green')
     
     # Weekday distribution
     weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    weekday_counts = df['weekday'].value_counts().reindex(weekday_order, fill_value=0)
-    fig.add_trace(
-        go.Bar(x=weekday_counts.index, y=weekday_counts.values, 
-               name='Weekday', marker_color='orange'),
-        row=2, col=1
-    )
+    weekday = go.Bar(x=weekday_order, y=weekday_counts, 
+                     name='Weekday', marker_color='orange')
     
     # Timeline
-    df_sorted = df.sort_values('datetime')
-    df_sorted['cumulative'] = range(1, len(df_sorted) + 1)
-    fig.add_trace(
-        go.Scatter(x=df_sorted['datetime'], y=df_sorted['cumulative'], 
-                  mode='lines', name='Cumulative Photos', line=dict(color='red')),
-        row=2, col=2
-    )
+    timeline = df['datetime'].sort_values(kind='stable')
+    cumulative = np.arange(1, len(timeline) + 1, dtype=np.int64)
+    cumulative_trace = go.Scatter(x=timeline.to_numpy(), y=cumulative, 
+                                  mode='lines', name='Cumulative Photos', line=dict(color='red'))
+    
+    # All four traces in one add_traces call
+    fig.add_traces([hourly, monthly, weekday, cumulative_trace], rows=[1, 1, 2, 2], cols=[1, 2, 1, 2])
     
     fig.update_layout(height=600, showlegend=False, title_text="Temporal Shooting Patterns")
     return fig
 
-def create_location_map(df):
-    """Create location-based map visualization"""
-    gps_df = df.dropna(subset=['latitude', 'longitude'])
-    
+@st.cache_resource(show_spinner=False, max_entries=4)
+def create_location_map(gps_df):
+    """Create location-based map visualization from the rows that have both GPS coordinates"""
     if len(gps_df) == 0:
         return None
     
-    fig = px.scatter_mapbox(
-        gps_df,
-        lat='latitude',
-        lon='longitude',
-        hover_name='filename',
-        hover_data=['camera', 'lens'],
-        zoom=10,
-        height=500,
-        title=f"Photo Locations ({len(gps_df)} photos with GPS data)"
-    )
+    # A WebGL scatter layer, so large GPS sets stay interactive. Only the plotted and tooltip
+    # columns are sent to the browser, with coordinates rounded to ~0.1 m to keep the JSON short
+    label_columns = [col for col in ('filename', 'camera', 'lens') if col in gps_df.columns]
+    points = gps_df[label_columns].astype('string').fillna('')
+    points['latitude'] = gps_df['latitude'].astype(np.float64).round(6)
+    points['longitude'] = gps_df['longitude'].astype(np.float64).round(6)
     
-    fig.update_layout(mapbox_style="open-street-map")
-    fig.update_layout(margin={"r":0,"t":50,"l":0,"b":0})
+    layer = pdk.Layer(
+        'ScatterplotLayer',
+        data=points,
+        get_position='[longitude, latitude]',
+        get_radius=50,
+        radius_min_pixels=3,
+        get_fill_color=[31, 119, 180, 180],
+        pickable=True
+    )
+    view_state = pdk.ViewState(
+        latitude=float(points['latitude'].mean()),
+        longitude=float(points['longitude'].mean()),
+        zoom=10
+    )
+    tooltip = {'text': '\n'.join(f'{{{col}}}' for col in label_columns)}
     
-    return fig
+    return pdk.Deck(layers=[layer], initial_view_state=view_state, tooltip=tooltip)
 
 # Main App Interface
 def main():
@@ -610,29 +956,36 @@ def main():
             # Processing options
             recursive = st.sidebar.checkbox("Include subdirectories", value=True)
             
+            # Extraction processes; fewer leaves cores free for other work on the machine
+            cpu_count = os.cpu_count() or 1
+            workers = st.sidebar.slider("Worker processes", 1, cpu_count, cpu_count) if cpu_count > 1 else 1
+            
             # Process button
             if st.sidebar.button("🔄 Process Photos", key="process_btn"):
                 if os.path.exists(st.session_state.selected_directory):
-                    with st.spinner("Processing photos..."):
+                    with st.sidebar.status("Processing photos...") as status:
                         try:
+                            # Extraction runs in worker processes, so the GIL doesn't serialize decoding
                             df = st.session_state.analyzer.process_photo_directory(
                                 st.session_state.selected_directory, 
-                                recursive=recursive
+                                recursive=recursive,
+                                workers=workers,
+                                progress=_status_progress(status, "Processing photos")
                             )
+                            df = _coerce_exif_dtypes(df)
                             st.session_state.df = df
+                            status.update(label=f"Processed {len(df)} photos", state="complete")
                             
                             if len(df) > 0:
                                 st.sidebar.success(f"✅ Processed {len(df)} photos!")
                                 
-                                # Auto-generate CSV
-                                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                                csv_filename = f"photo_metadata_{timestamp}.csv"
-                                csv_data = df.to_csv(index=False)
+                                # Auto-generate CSV through the staging area's buffered writer
+                                staging_op = st.session_state.staging_manager.stage_csv_creation(df, "photo_metadata")
                                 
                                 st.sidebar.download_button(
                                     label="💾 Download Processed CSV",
-                                    data=csv_data,
-                                    file_name=csv_filename,
+                                    data=_staged_file_data(staging_op['staged_path']),
+                                    file_name=staging_op['filename'],
                                     mime="text/csv",
                                     key="download_processed_csv"
                                 )
@@ -640,6 +993,7 @@ def main():
                                 st.sidebar.warning("⚠️ No photos with EXIF data found")
 
                         except Exception as e:
+                            status.update(label="Processing failed", state="error")
                             st.sidebar.error(f"❌ Error: {str(e)}")
                 else:
                     st.sidebar.error("❌ Directory not found!")
@@ -666,7 +1020,7 @@ def main():
         
         if uploaded_file:
             try:
-                st.session_state.df = pd.read_csv(uploaded_file)
+                st.session_state.df = _coerce_exif_dtypes(pd.read_csv(uploaded_file))
                 st.sidebar.success(f"✅ CSV loaded! ({len(st.session_state.df)} rows)")
             except Exception as e:
                 st.sidebar.error(f"❌ Error loading CSV: {str(e)}")
@@ -675,6 +1029,18 @@ def main():
     if st.session_state.df is not None:
         df = st.session_state.df
         
+        # Column checks and the GPS subset are shared by the metrics and charts below
+        cols = frozenset(df.columns)
+        if {'latitude', 'longitude'} <= cols:
+            gps_df = df.dropna(subset=['latitude', 'longitude'])
+        else:
+            gps_df = df.iloc[:0]
+        
+        # Equipment counts feed both the quick insights and the usage charts; the columns are
+        # categorical (see _coerce_exif_dtypes), so these are bincounts over their codes
+        camera_counts = df['camera'].value_counts() if 'camera' in cols else None
+        lens_counts = df['lens'].value_counts() if 'lens' in cols else None
+        
         # Show processing summary if from directory
         if data_source == "🗂️ Browse Photo Directory" and st.session_state.selected_directory:
             st.markdown(f"""
@@ -693,16 +1059,16 @@ def main():
             st.metric("Total Photos", len(df))
         
         with col2:
-            unique_cameras = df['camera'].nunique() if 'camera' in df.columns else 0
+            # Categorical columns report unused categories with a zero count
+            unique_cameras = int((camera_counts > 0).sum()) if camera_counts is not None else 0
             st.metric("Cameras Used", unique_cameras)
         
         with col3:
-            unique_lenses = df['lens'].nunique() if 'lens' in df.columns else 0
+            unique_lenses = int((lens_counts > 0).sum()) if lens_counts is not None else 0
             st.metric("Lenses Used", unique_lenses)
         
         with col4:
-            gps_photos = len(df.dropna(subset=['latitude', 'longitude'])) if 'latitude' in df.columns else 0
-            st.metric("GPS Tagged Photos", gps_photos)
+            st.metric("GPS Tagged Photos", len(gps_df))
         
         # Quick insights
         if len(df) > 0:
@@ -711,14 +1077,14 @@ def main():
             insights_col1, insights_col2 = st.columns(2)
             
             with insights_col1:
-                if 'camera' in df.columns and not df['camera'].empty:
-                    most_used_camera = df['camera'].mode().iloc[0]
-                    camera_count = df['camera'].value_counts().iloc[0]
+                if camera_counts is not None and not camera_counts.empty:
+                    most_used_camera = camera_counts.index[0]
+                    camera_count = camera_counts.iloc[0]
                     camera_pct = (camera_count / len(df) * 100)
                     st.info(f"🎥 Most used camera: **{most_used_camera}** ({camera_count} photos, {camera_pct:.1f}%)")
             
             with insights_col2:
-                if 'iso' in df.columns and not df['iso'].empty:
+                if 'iso' in cols and not df['iso'].empty:
                     avg_iso = df['iso'].mean()
                     max_iso = df['iso'].max()
                     st.info(f"📊 ISO usage: Average **{avg_iso:.0f}**, Max **{max_iso:.0f}**")
@@ -730,13 +1096,13 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            if 'camera' in df.columns:
-                camera_chart = create_camera_usage_chart(df)
+            if camera_counts is not None:
+                camera_chart = create_camera_usage_chart(camera_counts)
                 st.plotly_chart(camera_chart, use_container_width=True)
         
         with col2:
-            if 'lens' in df.columns:
-                lens_chart = create_lens_usage_chart(df)
+            if lens_counts is not None:
+                lens_chart = create_lens_usage_chart(lens_counts)
                 st.plotly_chart(lens_chart, use_container_width=True)
         
         # Camera settings analysis
@@ -749,9 +1115,10 @@ def main():
             st.plotly_chart(temporal_chart, use_container_width=True)
         
         # Location map
-        location_map = create_location_map(df)
+        location_map = create_location_map(gps_df)
         if location_map:
-            st.plotly_chart(location_map, use_container_width=True)
+            st.markdown(f"#### 🗺️ Photo Locations ({len(gps_df)} photos with GPS data)")
+            st.pydeck_chart(location_map)
         
         # Data export section
         st.markdown("---")
@@ -780,7 +1147,7 @@ def main():
         with tab1:
             st.markdown("#### Stage New File Operations")
             
-            col1, col2 = st.columns(2)
+            col1, col2, col3, col4 = st.columns(4)
             
             with col1:
                 if st.button("📊 Stage CSV Export", key="stage_csv"):
@@ -798,12 +1165,25 @@ def main():
                             'total_photos': len(df),
                             'source_directory': st.session_state.selected_directory
                         },
-                        'insights': insights,
+                        'insights': insights.to_dict(),
                         'photo_data': df.to_dict('records')
                     }
                     staging_op = st.session_state.staging_manager.stage_json_creation(json_data, "photo_analysis")
                     st.success(f"✅ JSON staged: {staging_op['filename']}")
                     logger.info(f"User manually staged JSON: {staging_op['operation_id']}")
+            
+            # Binary formats are smaller and faster to stage; CSV is converted from them on download
+            with col3:
+                if st.button("🪶 Stage Feather Export", key="stage_feather"):
+                    staging_op = st.session_state.staging_manager.stage_feather_creation(df, "photo_metadata")
+                    st.success(f"✅ Staged: {staging_op['filename']}")
+                    logger.info(f"User manually staged Feather: {staging_op['operation_id']}")
+            
+            with col4:
+                if st.button("🗜️ Stage Parquet Export", key="stage_parquet"):
+                    staging_op = st.session_state.staging_manager.stage_parquet_creation(df, "photo_metadata")
+                    st.success(f"✅ Staged: {staging_op['filename']}")
+                    logger.info(f"User manually staged Parquet: {staging_op['operation_id']}")
         
         with tab2:
             st.markdown("#### Preview and Commit Staged Operations")
@@ -812,8 +1192,13 @@ def main():
             pending_ops = [op for op in staged_ops if op['status'] == 'staged']
             
             if pending_ops:
+                previews = {}
+                if st.button("🔍 Preview All", key="preview_all"):
+                    operation_ids = [op['operation_id'] for op in pending_ops]
+                    previews = dict(zip(operation_ids, st.session_state.staging_manager.preview_operations(operation_ids)))
+                
                 for operation in pending_ops:
-                    with st.expander(f"📁 {operation['filename']} ({operation['size_mb']:.2f} MB)"):
+                    with st.expander(f"📁 {operation['filename']} ({operation['size_mb']:.2f} MB)", expanded=bool(previews)):
                         col1, col2 = st.columns([2, 1])
                         
                         with col1:
@@ -822,25 +1207,32 @@ def main():
                             st.write(f"**Size:** {operation['size_mb']:.2f} MB")
                             
                             # Show preview
+                            preview = previews.get(operation['operation_id'])
                             if st.button(f"🔍 Preview", key=f"preview_{operation['operation_id']}"):
                                 preview = st.session_state.staging_manager.preview_operation(operation['operation_id'])
-                                if preview and preview['preview_content']:
-                                    st.json(preview['preview_content'])
+                            if preview and preview['preview_content']:
+                                st.json(preview['preview_content'])
                         
                         with col2:
                             # Download staged file
                             if os.path.exists(operation['staged_path']):
-                                with open(operation['staged_path'], 'rb') as f:
-                                    file_data = f.read()
-                                
                                 st.download_button(
                                     label="💾 Download",
-                                    data=file_data,
+                                    data=_staged_file_data(operation['staged_path']),
                                     file_name=operation['filename'],
-                                    mime="text/csv" if operation['type'] == 'create_csv' else "application/json",
+                                    mime=STAGED_MIME_TYPES.get(operation['type'], "application/octet-stream"),
                                     key=f"download_{operation['operation_id']}"
                                 )
                                 
+                                if operation['type'] in ('create_feather', 'create_parquet'):
+                                    st.download_button(
+                                        label="💾 Download as CSV",
+                                        data=_staged_csv_data(operation['staged_path']),
+                                        file_name=f"{Path(operation['filename']).stem}.csv",
+                                        mime="text/csv",
+                                        key=f"download_csv_{operation['operation_id']}"
+                                    )
+                                
                                 # Mark as committed after download
                                 if st.button("✅ Mark Committed", key=f"commit_{operation['operation_id']}"):
                                     success, message = st.session_state.staging_manager.commit_operation(operation['operation_id'])
@@ -873,28 +1265,32 @@ def main():
         st.markdown("### 📥 Quick Downloads")
         col1, col2, col3 = st.columns(3)
         
+        # Built when the button is clicked where supported, instead of held for every rerun
         with col1:
-            csv = df.to_csv(index=False)
             st.download_button(
                 label="📊 Quick CSV Download",
-                data=csv,
+                data=partial(_csv_payload, df) if DEFERRED_DOWNLOADS else _csv_bytes(df),
                 file_name=f"photo_metadata_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
         
         with col2:
             # JSON export
-            json_data = df.to_json(orient='records', date_format='iso')
             st.download_button(
                 label="📋 Quick JSON Download",
-                data=json_data,
+                data=partial(_json_payload, df) if DEFERRED_DOWNLOADS else _json_bytes(df),
                 file_name=f"photo_metadata_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json"
             )
         
         with col3:
-            if st.button("👁️ Show Raw Data"):
-                st.dataframe(df, use_container_width=True)
+            # A checkbox rather than a button, so the page selector survives its own reruns
+            if st.checkbox("👁️ Show Raw Data", key="show_raw_data"):
+                page_count = max(1, -(-len(df) // RAW_DATA_PAGE_ROWS))
+                page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1) if page_count > 1 else 1
+                start = (page - 1) * RAW_DATA_PAGE_ROWS
+                st.caption(f"Rows {start + 1}–{min(start + RAW_DATA_PAGE_ROWS, len(df))} of {len(df)}")
+                st.dataframe(df.iloc[start:start + RAW_DATA_PAGE_ROWS], use_container_width=True)
     
     else:
         # Welcome screen
@@ -947,9 +1343,6 @@ if __name__ == "__main__":
         logger.info("Application interrupted by user")
     except Exception as e:
         logger.error(f"Unexpected error in main application: {str(e)}")
-    finally:
-        # Cleanup on exit
-        stop_file_monitoring()
-        if 'staging_manager' in st.session_state:
-            st.session_state.staging_manager.cleanup()
-        logger.info("Application cleanup completed")
\ No newline at end of file
+    # Streamlit executes this block on every rerun, so the observer and staging area are not
+    # torn down here: the observer threads are daemons and the staging directory is removed
+    # by the atexit hook registered with the StagingManager
\ No newline at end of file
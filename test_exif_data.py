@@ -5,118 +5,238 @@
 
 import sys
 import os
-from PIL import Image
+import io
+import hashlib
+import numpy as np
+from PIL import Image, __version__ as PILLOW_VERSION
 from PIL.ExifTags import TAGS, GPSTAGS
 import json
 from datetime import datetime
 
-def extract_all_exif(image_path):
-    """Extract and display all EXIF data from an image"""
+# Optional fast JSON codec for the cache; the stdlib json module is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed reports per file, named by a hash of path, mtime and size so edited files are re-read
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "photo-tools", "exif")
+
+# Bump whenever read_all_exif or format_exif_report change what they produce; it is part of
+# the cache key along with the Pillow version, so older entries are never replayed
+CACHE_VERSION = 1
+
+# JPEG headers (APP1 EXIF segment and SOF dimensions) fit well within this prefix
+JPEG_HEADER_BYTES = 128 * 1024
+
+def exif_cache_path(image_path):
+    """Cache file for the current version of image_path, report format and Pillow"""
+    stat = os.stat(image_path)
+    key = (f"{CACHE_VERSION}:{PILLOW_VERSION}:{os.path.abspath(image_path)}:"
+           f"{stat.st_mtime_ns}:{stat.st_size}")
+    return os.path.join(CACHE_DIR, hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + ".json")
+
+def load_cached_exif(cache_path):
+    """Cached {"lines": [...], "exif": {...}} entry, or None if missing or unreadable"""
+    try:
+        with open(cache_path, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+def store_cached_exif(cache_path, lines, readable_exif):
+    """Write a cache entry; tag values are stored in the same JSON form main() saves"""
+    entry = {"lines": lines, "exif": readable_exif}
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(entry, default=str))
+            else:
+                f.write(json.dumps(entry, default=str).encode('utf-8'))
+    except (OSError, TypeError) as e:
+        print(f"⚠️ Could not update cache {cache_path}: {str(e)}")
+
+def extract_all_exif(image_path, use_cache=False, verbose=True):
+    """Extract and display all EXIF data from an image
+    
+    With use_cache, an unchanged file's report is replayed from CACHE_DIR instead of
+    re-parsed; cached tag values come back in JSON form (strings for rationals and bytes).
+    verbose=False skips building and printing the report (and so only reads the cache).
+    """
     
     if not os.path.exists(image_path):
-        print(f"❌ File not found: {image_path}")
+        if verbose:
+            print(f"❌ File not found: {image_path}")
         return None
     
+    cache_path = exif_cache_path(image_path) if use_cache else None
+    cached = load_cached_exif(cache_path) if cache_path else None
+    if cached is not None:
+        if verbose:
+            sys.stdout.write("\n".join(cached['lines']) + "\n")
+        return cached['exif']
+    
+    if not verbose:
+        return read_all_exif(image_path)
+    
+    # Report lines are collected and written in one call instead of one print per tag
+    lines = []
+    readable_exif = read_all_exif(image_path, lines)
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    if readable_exif is not None and cache_path:
+        store_cached_exif(cache_path, lines, readable_exif)
+    return readable_exif
+
+def open_image(image_path):
+    """Open an image, parsing JPEGs from their header prefix instead of the whole file"""
+    with open(image_path, 'rb') as f:
+        head = f.read(JPEG_HEADER_BYTES)
+    
+    if head[:2] == b'\xff\xd8':
+        try:
+            img = Image.open(io.BytesIO(head))
+            img.getexif()
+            return img
+        except Exception:
+            # Header runs past the prefix; fall back to the full file
+            pass
+    
+    return Image.open(image_path)
+
+def read_all_exif(image_path, lines=None):
+    """Parse all EXIF tags of an image, appending the report to lines unless it is None"""
+    tag_name_of = TAGS.get
+    gps_tag_name_of = GPSTAGS.get
+    
     try:
         # Open image and get EXIF data
-        with Image.open(image_path) as img:
-            print(f"📸 Image: {os.path.basename(image_path)}")
-            print(f"📏 Size: {img.size}")
-            print(f"🎨 Format: {img.format}")
-            print(f"🔧 Mode: {img.mode}")
-            print("-" * 50)
+        with open_image(image_path) as img:
+            if lines is not None:
+                lines.append(f"📸 Image: {os.path.basename(image_path)}")
+                lines.append(f"📏 Size: {img.size}")
+                lines.append(f"🎨 Format: {img.format}")
+                lines.append(f"🔧 Mode: {img.mode}")
+                lines.append("-" * 50)
             
             exif_data = img.getexif()
             
             if not exif_data:
-                print("❌ No EXIF data found in this image")
+                if lines is not None:
+                    lines.append("❌ No EXIF data found in this image")
                 return None
             
-            print(f"✅ Found {len(exif_data)} EXIF tags")
-            print("=" * 50)
-            
-            # Process all EXIF tags
-            readable_exif = {}
-            gps_data = None
-            
+            # Name every tag in one pass; GPSInfo's sub-IFD gets the GPS tag names
+            named_tags = []
             for tag_id, value in exif_data.items():
-                tag_name = TAGS.get(tag_id, f"Unknown_{tag_id}")
-                
-                # Handle GPS data specially
+                tag_name = tag_name_of(tag_id) or f"Unknown_{tag_id}"
                 if tag_name == 'GPSInfo':
-                    gps_data = {}
-                    print("\n📍 GPS Information:")
-                    for gps_tag_id, gps_value in value.items():
-                        gps_tag_name = GPSTAGS.get(gps_tag_id, f"GPS_Unknown_{gps_tag_id}")
-                        gps_data[gps_tag_name] = gps_value
-                        print(f"  {gps_tag_name}: {gps_value}")
-                    readable_exif[tag_name] = gps_data
-                else:
-                    readable_exif[tag_name] = value
-                    # Format output nicely
-                    if isinstance(value, bytes):
-                        display_value = f"<bytes: {len(value)} bytes>"
-                    elif isinstance(value, (list, tuple)) and len(str(value)) > 100:
-                        display_value = f"<{type(value).__name__}: {len(value)} items>"
-                    else:
-                        display_value = str(value)[:100] + "..." if len(str(value)) > 100 else value
-                    
-                    print(f"{tag_name:25} : {display_value}")
-            
-            # Show GPS coordinates if available
-            if gps_data and 'GPSLatitude' in gps_data and 'GPSLongitude' in gps_data:
-                try:
-                    lat = convert_gps_to_decimal(gps_data)
-                    if lat[0] is not None and lat[1] is not None:
-                        print(f"\n🌍 Decimal GPS: {lat[0]:.6f}, {lat[1]:.6f}")
-                except:
-                    print("\n⚠️ Could not convert GPS coordinates")
+                    value = {gps_tag_name_of(gps_tag_id) or f"GPS_Unknown_{gps_tag_id}": gps_value
+                             for gps_tag_id, gps_value in value.items()}
+                named_tags.append((tag_name, value))
+            readable_exif = dict(named_tags)
             
+            if lines is not None:
+                format_exif_report(named_tags, lines)
             return readable_exif
             
     except Exception as e:
-        print(f"❌ Error reading image: {str(e)}")
+        if lines is not None:
+            lines.append(f"❌ Error reading image: {str(e)}")
         return None
 
-def convert_gps_to_decimal(gps_info):
-    """Convert GPS coordinates to decimal degrees"""
-    if not gps_info or 'GPSLatitude' not in gps_info or 'GPSLongitude' not in gps_info:
-        return None, None
+def format_exif_report(named_tags, lines):
+    """Append the per-tag report for (tag name, value) pairs to lines"""
+    lines.append(f"✅ Found {len(named_tags)} EXIF tags")
+    lines.append("=" * 50)
+    
+    gps_data = None
+    for tag_name, value in named_tags:
+        # Handle GPS data specially
+        if tag_name == 'GPSInfo':
+            gps_data = value
+            lines.append("\n📍 GPS Information:")
+            lines.extend(f"  {gps_tag_name}: {gps_value}" for gps_tag_name, gps_value in value.items())
+            continue
         
-    def convert_to_degrees(value):
-        d, m, s = float(value[0]), float(value[1]), float(value[2])
-        return d + (m / 60.0) + (s / 3600.0)
+        # Format output nicely; maker-note blobs are only measured, never stringified
+        if isinstance(value, bytes):
+            display_value = f"<bytes: {len(value)} bytes>"
+        else:
+            text = str(value)
+            if len(text) <= 100:
+                display_value = text
+            elif isinstance(value, (list, tuple)):
+                display_value = f"<{type(value).__name__}: {len(value)} items>"
+            else:
+                display_value = text[:100] + "..."
+        
+        lines.append(f"{tag_name:25} : {display_value}")
     
-    lat = convert_to_degrees(gps_info['GPSLatitude'])
-    lon = convert_to_degrees(gps_info['GPSLongitude'])
+    # Show GPS coordinates if available
+    if gps_data and 'GPSLatitude' in gps_data and 'GPSLongitude' in gps_data:
+        try:
+            lat = convert_gps_to_decimal(gps_data)
+            if lat[0] is not None and lat[1] is not None:
+                lines.append(f"\n🌍 Decimal GPS: {lat[0]:.6f}, {lat[1]:.6f}")
+        except:
+            lines.append("\n⚠️ Could not convert GPS coordinates")
+
+def dms_to_degrees(values):
+    """Decimal degrees from N degrees/minutes/seconds triples"""
+    dms = np.asarray(values, dtype=np.float64).reshape(-1, 3)
+    return dms[:, 0] + (dms[:, 1] / 60.0) + (dms[:, 2] / 3600.0)
+
+def gps_to_decimal_batch(lat_values, lat_refs, lon_values, lon_refs):
+    """Signed decimal (latitudes, longitudes) arrays for N photos' DMS triples and N/S, E/W refs"""
+    lat = dms_to_degrees(lat_values)
+    lon = dms_to_degrees(lon_values)
     
     # Check direction
-    if gps_info.get('GPSLatitudeRef') == 'S':
-        lat = -lat
-    if gps_info.get('GPSLongitudeRef') == 'W':
-        lon = -lon
-        
+    lat = np.where(np.asarray(lat_refs, dtype=object) == 'S', -lat, lat)
+    lon = np.where(np.asarray(lon_refs, dtype=object) == 'W', -lon, lon)
     return lat, lon
 
+def convert_gps_to_decimal(gps_info):
+    """Convert GPS coordinates to decimal degrees"""
+    if not gps_info or 'GPSLatitude' not in gps_info or 'GPSLongitude' not in gps_info:
+        return None, None
+    
+    lat, lon = gps_to_decimal_batch(
+        [gps_info['GPSLatitude']], [gps_info.get('GPSLatitudeRef')],
+        [gps_info['GPSLongitude']], [gps_info.get('GPSLongitudeRef')]
+    )
+    return float(lat[0]), float(lon[0])
+
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python test_exif.py <image_path>")
+    args = sys.argv[1:]
+    use_cache = '--cache' in args
+    args = [arg for arg in args if arg != '--cache']
+    
+    if len(args) != 1:
+        print("Usage: python test_exif.py [--cache] <image_path>")
         print("Example: python test_exif.py /path/to/photo.jpg")
         sys.exit(1)
     
-    image_path = sys.argv[1]
+    image_path = args[0]
     
     print("🔍 EXIF Data Extraction Test")
     print("=" * 50)
     
-    exif_data = extract_all_exif(image_path)
+    exif_data = extract_all_exif(image_path, use_cache=use_cache)
     
     if exif_data:
         # Save to JSON file for detailed inspection
         output_file = f"exif_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            with open(output_file, 'w') as f:
-                json.dump(exif_data, f, indent=2, default=str)
+            if orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(exif_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str))
+            else:
+                with open(output_file, 'w') as f:
+                    json.dump(exif_data, f, indent=2, default=str)
             print(f"\n💾 Detailed EXIF data saved to: {output_file}")
         except Exception as e:
             print(f"⚠️ Could not save JSON file: {str(e)}")